@@ -5,11 +5,18 @@ Comparison by SKU (primary key), fuzzy name matching, and attribute comparison.
 
 import os
 import json
+import pickle
 import re
+from functools import reduce
+from itertools import combinations
+import numpy as np
 import pandas as pd
-from thefuzz import fuzz
+from rapidfuzz import fuzz, process
 import config
 
+# Numeric token in weight / dimension strings ("170.23 lb", "48 in x 40 in x 30 in")
+_NUMBER_RE = re.compile(r"([\d.]+)")
+
 
 def merge_by_sku(sources):
     """
@@ -20,35 +27,42 @@ def merge_by_sku(sources):
     if not source_names:
         return pd.DataFrame()
 
-    # Collect all unique SKUs
-    all_skus = set()
+    # One frame per source: first row per non-empty SKU, columns suffixed by source
+    frames = []
     for name, df in sources.items():
-        skus = df[df["sku"].str.len() > 0]["sku"].unique()
-        all_skus.update(skus)
-
-    rows = []
-    for sku in sorted(all_skus):
-        row = {"sku": sku}
-        for name, df in sources.items():
-            match = df[df["sku"] == sku]
-            if not match.empty:
-                first = match.iloc[0]
-                row[f"name_{name}"] = first["product_name"]
-                row[f"price_{name}"] = first["price"]
-                row[f"sale_price_{name}"] = first.get("sale_price")
-                row[f"category_{name}"] = first["category"]
-                row[f"status_{name}"] = first.get("status", "")
-                row[f"in_{name}"] = True
-            else:
-                row[f"name_{name}"] = None
-                row[f"price_{name}"] = None
-                row[f"sale_price_{name}"] = None
-                row[f"category_{name}"] = None
-                row[f"status_{name}"] = None
-                row[f"in_{name}"] = False
-        rows.append(row)
-
-    return pd.DataFrame(rows)
+        sku = df["sku"]
+        part = df[sku.notna() & sku.ne("")].drop_duplicates(subset="sku", keep="first")
+        part = part[["sku", "product_name", "price", "sale_price", "category", "status"]].rename(columns={
+            "product_name": f"name_{name}",
+            "price": f"price_{name}",
+            "sale_price": f"sale_price_{name}",
+            "category": f"category_{name}",
+            "status": f"status_{name}",
+        })
+        part[f"in_{name}"] = True
+        frames.append(part)
+
+    merged = reduce(lambda a, b: a.merge(b, on="sku", how="outer"), frames)
+    merged = merged.sort_values("sku", ignore_index=True)
+
+    for name in source_names:
+        # Outer join leaves NaN for absent SKUs — keep None for names
+        col = f"name_{name}"
+        merged[col] = merged[col].astype(object).where(merged[col].notna(), None)
+        # Categories and statuses repeat heavily — store them as categoricals
+        for col in (f"category_{name}", f"status_{name}"):
+            merged[col] = merged[col].astype("category")
+        merged[f"in_{name}"] = merged[f"in_{name}"].notna()
+
+    return merged
+
+
+def _first_name(merged, source_names):
+    """Name from the first source with a non-empty one, "" if none has it."""
+    names = merged[[f"name_{s}" for s in source_names]]
+    # Absent sources already hold None, so only empty strings need masking
+    names = names.where(names.notna() & names.ne(""))
+    return names.bfill(axis=1).iloc[:, 0].fillna("")
 
 
 def find_missing(merged, sources):
@@ -56,32 +70,45 @@ def find_missing(merged, sources):
     Find products missing from one or more sources.
     """
     source_names = list(sources.keys())
-    missing_rows = []
-
-    for _, row in merged.iterrows():
-        present_in = [s for s in source_names if row.get(f"in_{s}", False)]
-        absent_from = [s for s in source_names if not row.get(f"in_{s}", False)]
-
-        if absent_from:
-            # Get name from the first available source
-            name = None
-            for s in present_in:
-                if row.get(f"name_{s}"):
-                    name = row[f"name_{s}"]
-                    break
+    if merged.empty:
+        return pd.DataFrame()
+
+    # Presence matrix: rows = SKUs, columns = sources
+    in_matrix = merged[[f"in_{s}" for s in source_names]].to_numpy(dtype=bool)
+    gap_idx = np.flatnonzero(~in_matrix.all(axis=1))
+    names_arr = np.array(source_names)
+
+    first_name = _first_name(merged, source_names)
 
-            # Get Zoho status if available
-            zoho_status = row.get("status_zoho", "") or ""
+    # Get Zoho status if available
+    if "status_zoho" in merged.columns:
+        zoho_status = merged["status_zoho"].astype(object).fillna("").to_numpy()[gap_idx]
+    else:
+        zoho_status = [""] * len(gap_idx)
 
-            missing_rows.append({
-                "sku": row["sku"],
-                "product_name": name or "",
-                "present_in": ", ".join(present_in),
-                "absent_from": ", ".join(absent_from),
-                "zoho_status": zoho_status,
-            })
+    return pd.DataFrame({
+        "sku": merged["sku"].to_numpy()[gap_idx],
+        "product_name": first_name.to_numpy()[gap_idx],
+        "present_in": [", ".join(names_arr[in_matrix[i]]) for i in gap_idx],
+        "absent_from": [", ".join(names_arr[~in_matrix[i]]) for i in gap_idx],
+        "zoho_status": zoho_status,
+    })
 
-    return pd.DataFrame(missing_rows)
+
+def _row_spread(matrix):
+    """Per-row (non-NaN count, min, max - min) of a (rows x sources) float matrix.
+
+    Two-source tables (the common case) are compared column-to-column with
+    elementwise fmin/fmax instead of going through the generic reductions.
+    """
+    if matrix.shape[1] == 2:
+        a, b = matrix[:, 0], matrix[:, 1]
+        count = (~np.isnan(a)).astype(np.intp) + (~np.isnan(b))
+        lo, hi = np.fmin(a, b), np.fmax(a, b)
+    else:
+        count = (~np.isnan(matrix)).sum(axis=1)
+        lo, hi = np.fmin.reduce(matrix, axis=1), np.fmax.reduce(matrix, axis=1)
+    return count, lo, hi - lo
 
 
 def find_price_differences(merged, sources):
@@ -89,49 +116,30 @@ def find_price_differences(merged, sources):
     Find products with different prices across sources.
     """
     source_names = list(sources.keys())
-    diff_rows = []
-
-    for _, row in merged.iterrows():
-        prices = {}
-        for s in source_names:
-            if row.get(f"in_{s}", False) and pd.notna(row.get(f"price_{s}")):
-                prices[s] = row[f"price_{s}"]
-
-        if len(prices) < 2:
-            continue
+    if merged.empty:
+        return pd.DataFrame()
 
-        price_values = list(prices.values())
-        max_price = max(price_values)
-        min_price = min(price_values)
-        abs_diff = max_price - min_price
+    # Prices as a (SKUs x sources) float matrix, NaN where absent
+    price_cols = [f"price_{s}" for s in source_names]
+    prices = merged[price_cols].to_numpy(dtype=np.float64)
+    n_present, min_price, abs_diff = _row_spread(prices)
 
-        # Check acceptable tolerance
-        if abs_diff <= config.PRICE_TOLERANCE:
-            continue
+    # Check acceptable tolerance
+    keep = (n_present >= 2) & (abs_diff > config.PRICE_TOLERANCE)
+    if config.PRICE_TOLERANCE_PERCENT > 0:
+        safe_min = np.where(min_price > 0, min_price, 1)
+        pct_diff = (abs_diff / safe_min) * 100
+        keep &= ~((min_price > 0) & (pct_diff <= config.PRICE_TOLERANCE_PERCENT))
 
-        if config.PRICE_TOLERANCE_PERCENT > 0 and min_price > 0:
-            pct_diff = (abs_diff / min_price) * 100
-            if pct_diff <= config.PRICE_TOLERANCE_PERCENT:
-                continue
+    first_name = _first_name(merged, source_names)
 
-        # Get name from the first available source
-        name = None
-        for s in source_names:
-            if row.get(f"name_{s}"):
-                name = row[f"name_{s}"]
-                break
-
-        diff_row = {
-            "sku": row["sku"],
-            "product_name": name or "",
-            "price_diff": round(abs_diff, 2),
-        }
-        for s in source_names:
-            diff_row[f"price_{s}"] = prices.get(s)
-
-        diff_rows.append(diff_row)
-
-    return pd.DataFrame(diff_rows)
+    columns = {
+        "sku": merged["sku"].to_numpy()[keep],
+        "product_name": first_name.to_numpy()[keep],
+        "price_diff": np.round(abs_diff[keep], 2),
+    }
+    columns.update({col: prices[keep, j] for j, col in enumerate(price_cols)})
+    return pd.DataFrame(columns)
 
 
 def find_name_differences(merged, sources):
@@ -139,68 +147,82 @@ def find_name_differences(merged, sources):
     Find products with different names (fuzzy matching).
     """
     source_names = list(sources.keys())
-    diff_rows = []
+    if merged.empty:
+        return pd.DataFrame()
 
-    for _, row in merged.iterrows():
-        names = {}
-        for s in source_names:
-            if row.get(f"in_{s}", False) and row.get(f"name_{s}"):
-                names[s] = row[f"name_{s}"]
+    names = {s: merged[f"name_{s}"].fillna("").to_numpy(dtype=object) for s in source_names}
+    has_name = {s: merged[f"in_{s}"].to_numpy(dtype=bool) & (names[s] != "") for s in source_names}
+    # Lowercase each name column once, not once per compared pair
+    lower = {s: merged[f"name_{s}"].fillna("").str.lower().to_numpy(dtype=object) for s in source_names}
+
+    # Collect the differing (lowercased) name pairs for every pair of sources.
+    # Identical names score 100 and are never reported — skip the edit distance.
+    candidates = []
+    for s1, s2 in combinations(source_names, 2):
+        both = np.flatnonzero(has_name[s1] & has_name[s2] & (lower[s1] != lower[s2]))
+        if len(both):
+            pairs = [(a, b) if a <= b else (b, a) for a, b in zip(lower[s1][both], lower[s2][both])]
+            candidates.append((both, pairs))
+
+    # Score each distinct name pair once across all source pairs (a row where two
+    # sources agree and one differs needs a single ratio). Pairs scored in a
+    # previous run come from the cache; the rest go to RapidFuzz on all cores.
+    cache = load_cache("fuzzy_cache.pkl")
+    new_pairs = list({p for _, pairs in candidates for p in pairs if p not in cache})
+    if new_pairs:
+        scores = process.cpdist(
+            [a for a, _ in new_pairs], [b for _, b in new_pairs],
+            scorer=fuzz.ratio, dtype=np.float64, workers=-1,
+        )
+        # Integer scores, as thefuzz reported them
+        cache.update(zip(new_pairs, np.round(scores).astype(int).tolist()))
+
+    seen = {}
+    has_diff = np.zeros(len(merged), dtype=bool)
+    for both, pairs in candidates:
+        ratio = np.array([cache[p] for p in pairs])
+        seen.update(zip(pairs, ratio.tolist()))
+        has_diff[both] |= (ratio < 100) & (ratio >= config.FUZZY_MATCH_THRESHOLD)
+
+    # Keep only pairs from this run so the cache tracks the current catalog
+    save_cache("fuzzy_cache.pkl", seen)
+
+    columns = {"sku": merged["sku"].to_numpy()[has_diff]}
+    for s in source_names:
+        columns[f"name_{s}"] = np.where(has_name[s], names[s], "")[has_diff]
+    return pd.DataFrame(columns)
+
+
+def _parse_weight(values):
+    """Extract numeric weights from strings like '170.23 lb', '110.23', '50 kg'.
+
+    Works on a whole Series; kg values are converted to lb. Unparseable or
+    zero weights come back as NaN.
+    """
+    s = values.fillna("").astype(str).str.strip().str.lower().str.replace(",", "", regex=False)
+    w = pd.to_numeric(s.str.extract(_NUMBER_RE, expand=False), errors="coerce")
+    w = w.where(~s.str.contains("kg", regex=False), (w * 2.20462).round(2)).round(2)
+    return w.where(w != 0)
 
-        if len(names) < 2:
-            continue
 
-        # Compare all pairs
-        name_list = list(names.items())
-        has_diff = False
-        for i in range(len(name_list)):
-            for j in range(i + 1, len(name_list)):
-                s1, n1 = name_list[i]
-                s2, n2 = name_list[j]
-                ratio = fuzz.ratio(n1.lower(), n2.lower())
-                if ratio < 100 and ratio >= config.FUZZY_MATCH_THRESHOLD:
-                    has_diff = True
-
-        if has_diff:
-            diff_row = {"sku": row["sku"]}
-            for s in source_names:
-                diff_row[f"name_{s}"] = names.get(s, "")
-            diff_rows.append(diff_row)
-
-    return pd.DataFrame(diff_rows)
-
-
-def _parse_weight(val):
-    """Extract numeric weight value from string like '170.23 lb', '110.23', etc."""
-    if not val or (isinstance(val, float) and pd.isna(val)):
-        return None
-    s = str(val).strip().lower().replace(",", "")
-    m = re.search(r"([\d.]+)", s)
-    if m:
-        try:
-            w = float(m.group(1))
-            # Convert kg to lb if needed
-            if "kg" in s:
-                w = round(w * 2.20462, 2)
-            return round(w, 2)
-        except ValueError:
-            pass
-    return None
-
-
-def _parse_dimensions(val):
-    """Extract LxWxH dimensions as tuple of floats."""
-    if not val or (isinstance(val, float) and pd.isna(val)):
-        return None
-    s = str(val).strip().lower().replace('"', '').replace("'", "")
-    # Match patterns like "48 in x 40 in x 30 in" or "48 x 40 x 30"
-    nums = re.findall(r"([\d.]+)", s)
-    if len(nums) >= 3:
-        try:
-            return tuple(round(float(n), 2) for n in nums[:3])
-        except ValueError:
-            pass
-    return None
+def _parse_dimensions(values):
+    """Extract LxWxH dimensions as three float columns (NaN when unparseable)."""
+    s = (values.fillna("").astype(str).str.strip().str.lower()
+         .str.replace('"', "", regex=False).str.replace("'", "", regex=False))
+    # Match patterns like "48 in x 40 in x 30 in" or "48 x 40 x 30":
+    # one extractall over the column, keeping the first three numbers per row
+    nums = s.str.extractall(_NUMBER_RE)[0]
+    nums = nums[nums.index.get_level_values("match") < 3]
+    dims = (pd.to_numeric(nums, errors="coerce").round(2)
+            .unstack().reindex(index=s.index, columns=range(3)))
+    dims.columns = range(3)
+    return dims.where(dims.notna().all(axis=1))
+
+
+def _join_attrs(merged, attrs, columns):
+    """Left-join a {sku: {col: value}} dict onto merged, one row per merged row."""
+    frame = pd.DataFrame.from_dict(attrs, orient="index").reindex(columns=columns)
+    return merged[["sku"]].merge(frame, left_on="sku", right_index=True, how="left")
 
 
 def find_attribute_differences(merged, sources):
@@ -208,112 +230,80 @@ def find_attribute_differences(merged, sources):
     Compare attributes (weight, dimensions, category) across sources.
     Uses raw data from Zoho API cache, website CSV, and Google Sheets.
     """
-    # Load raw attribute data from each source
-    zoho_attrs = _load_zoho_raw_attrs()
-    web_attrs = _load_website_raw_attrs()
-    google_attrs = _load_google_raw_attrs()
+    # Load raw attribute data from each source and line it up with merged
+    zoho = _join_attrs(merged, _load_zoho_raw_attrs(),
+                       ["weight", "shipping_weight", "dimensions"])
+    web = _join_attrs(merged, _load_website_raw_attrs(), ["weight"])
+    google = _join_attrs(merged, _load_google_raw_attrs(),
+                         ["weight_lb", "shipping_weight_lb", "dimensions"])
 
     source_names = list(sources.keys())
-    diff_rows = []
-
-    for _, row in merged.iterrows():
-        sku = row["sku"]
-
-        # Count how many sources have this SKU
-        present = [s for s in source_names if row.get(f"in_{s}", False)]
-        if len(present) < 2:
+    zoho_dims = _parse_dimensions(zoho["dimensions"])
+    google_dims = _parse_dimensions(google["dimensions"])
+
+    # (attribute, {source: parsed values}) in output order per SKU
+    checks = [
+        ("Weight (lb)", {
+            "zoho": _parse_weight(zoho["weight"]),
+            "website": _parse_weight(web["weight"]),
+            "google": _parse_weight(google["weight_lb"]),  # Google has both Weight (lb) and Shipping Weight
+        }),
+        ("Shipping Weight (lb)", {
+            "zoho": _parse_weight(zoho["shipping_weight"]),
+            "google": _parse_weight(google["shipping_weight_lb"]),
+        }),
+    ]
+    for i, label in enumerate(["Length", "Width", "Height"]):
+        checks.append((f"Shipping {label} (in)", {
+            "zoho": zoho_dims[i], "google": google_dims[i],
+        }))
+
+    name = _first_name(merged, source_names)
+
+    parts = []
+    for order, (attribute, values) in enumerate(checks):
+        # Only count values from sources that actually carry this SKU
+        cols = {s: v.to_numpy(dtype=float) for s, v in values.items() if s in source_names}
+        if not cols:
+            continue
+        matrix = np.column_stack([
+            np.where(merged[f"in_{s}"].to_numpy(dtype=bool), v, np.nan)
+            for s, v in cols.items()
+        ])
+        has = ~np.isnan(matrix)
+        n_present, _, spread = _row_spread(matrix)
+        idx = np.flatnonzero((n_present >= 2) & (spread > 0.5))  # >0.5 tolerance
+        if not len(idx):
             continue
 
-        diffs = []
-
-        # --- Weight comparison ---
-        weights = {}
-        if "zoho" in present and sku in zoho_attrs:
-            w = _parse_weight(zoho_attrs[sku].get("weight"))
-            if w:
-                weights["zoho"] = w
-        if "website" in present and sku in web_attrs:
-            w = _parse_weight(web_attrs[sku].get("weight"))
-            if w:
-                weights["website"] = w
-        if "google" in present and sku in google_attrs:
-            # Google has both Weight (lb) and Shipping Weight
-            w = _parse_weight(google_attrs[sku].get("weight_lb"))
-            if w:
-                weights["google"] = w
-
-        if len(weights) >= 2:
-            vals = list(weights.values())
-            if max(vals) - min(vals) > 0.5:  # >0.5 lb tolerance
-                diffs.append({
-                    "attribute": "Weight (lb)",
-                    "values": weights,
-                    "diff": round(max(vals) - min(vals), 2),
-                })
-
-        # --- Shipping Weight comparison ---
-        ship_weights = {}
-        if "zoho" in present and sku in zoho_attrs:
-            w = _parse_weight(zoho_attrs[sku].get("shipping_weight"))
-            if w:
-                ship_weights["zoho"] = w
-        if "google" in present and sku in google_attrs:
-            w = _parse_weight(google_attrs[sku].get("shipping_weight_lb"))
-            if w:
-                ship_weights["google"] = w
-
-        if len(ship_weights) >= 2:
-            vals = list(ship_weights.values())
-            if max(vals) - min(vals) > 0.5:
-                diffs.append({
-                    "attribute": "Shipping Weight (lb)",
-                    "values": ship_weights,
-                    "diff": round(max(vals) - min(vals), 2),
-                })
-
-        # --- Dimensions comparison ---
-        dims = {}
-        if "zoho" in present and sku in zoho_attrs:
-            d = _parse_dimensions(zoho_attrs[sku].get("dimensions"))
-            if d:
-                dims["zoho"] = d
-        if "google" in present and sku in google_attrs:
-            d = _parse_dimensions(google_attrs[sku].get("dimensions"))
-            if d:
-                dims["google"] = d
-
-        if len(dims) >= 2:
-            # Compare each dimension
-            for i, label in enumerate(["Length", "Width", "Height"]):
-                vals = {s: d[i] for s, d in dims.items()}
-                v = list(vals.values())
-                if max(v) - min(v) > 0.5:
-                    diffs.append({
-                        "attribute": f"Shipping {label} (in)",
-                        "values": vals,
-                        "diff": round(max(v) - min(v), 2),
-                    })
-
-        if diffs:
-            # Get name from first available source
-            name = ""
-            for s in present:
-                if row.get(f"name_{s}"):
-                    name = row[f"name_{s}"]
-                    break
-
-            for d in diffs:
-                diff_row = {
-                    "sku": sku,
-                    "product_name": name,
-                    "attribute": d["attribute"],
-                    "diff": d["diff"],
-                }
-                for s in source_names:
-                    diff_row[f"value_{s}"] = d["values"].get(s, "")
-                diff_rows.append(diff_row)
+        part = {
+            "pos": idx,
+            "order": np.full(len(idx), order),
+            "attribute": np.full(len(idx), attribute, dtype=object),
+            "diff": np.round(spread[idx], 2),
+        }
+        for s in source_names:
+            col = np.full(len(idx), "", dtype=object)
+            if s in cols:
+                j = list(cols).index(s)
+                ok = has[idx, j]
+                col[ok] = matrix[idx, j][ok]
+            part[f"value_{s}"] = col
+        parts.append(part)
+
+    if not parts:
+        return pd.DataFrame()
 
-    return pd.DataFrame(diff_rows)
+    # Stitch the per-attribute columns together, ordered by SKU row then attribute
+    stacked = {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+    order = np.lexsort((stacked.pop("order"), stacked["pos"]))
+    pos = stacked.pop("pos")[order]
+    columns = {
+        "sku": merged["sku"].to_numpy()[pos],
+        "product_name": name.to_numpy()[pos],
+    }
+    columns.update({key: values[order] for key, values in stacked.items()})
+    return pd.DataFrame(columns)
 
 
 def _load_zoho_raw_attrs():
@@ -323,33 +313,27 @@ def _load_zoho_raw_attrs():
         return {}
     with open(cache_path, "r", encoding="utf-8") as f:
         items = json.load(f)
-    result = {}
-    for item in items:
-        sku = str(item.get("sku", "")).strip().upper()
-        if not sku:
-            continue
-        result[sku] = {
-            "weight": item.get("weight_with_unit", ""),
-            "shipping_weight": item.get("weight_with_unit", ""),  # Zoho uses same field
-            "dimensions": item.get("dimensions_with_unit", ""),
-        }
-    return result
+    df = pd.DataFrame(items, columns=["sku", "weight_with_unit", "dimensions_with_unit"])
+    df["sku"] = df["sku"].fillna("").astype(str).str.strip().str.upper()
+    df = df[df["sku"] != ""].drop_duplicates(subset="sku", keep="last")
+    df = df.rename(columns={"weight_with_unit": "weight", "dimensions_with_unit": "dimensions"})
+    df["shipping_weight"] = df["weight"]  # Zoho uses same field
+    return df.set_index("sku")[["weight", "shipping_weight", "dimensions"]].to_dict("index")
 
 
 def _load_website_raw_attrs():
     """Load raw attributes from website CSV."""
     if not os.path.exists(config.WEBSITE_CSV):
         return {}
-    df = pd.read_csv(config.WEBSITE_CSV, dtype=str, low_memory=False)
-    result = {}
-    for _, row in df.iterrows():
-        sku = str(row.get("SKU", "")).strip().upper()
-        if not sku:
-            continue
-        result[sku] = {
-            "weight": row.get("Weight (lbs)", ""),
-        }
-    return result
+    # Only parse the two columns we use out of the full WooCommerce export
+    df = pd.read_csv(config.WEBSITE_CSV, dtype=str,
+                     usecols=lambda c: c in ("SKU", "Weight (lbs)"))
+    if "SKU" not in df.columns:
+        return {}
+    df["sku"] = df["SKU"].fillna("").str.strip().str.upper()
+    df["weight"] = df["Weight (lbs)"] if "Weight (lbs)" in df.columns else ""
+    df = df[df["sku"] != ""].drop_duplicates(subset="sku", keep="last")
+    return df.set_index("sku")[["weight"]].to_dict("index")
 
 
 def _load_google_raw_attrs():
@@ -358,9 +342,9 @@ def _load_google_raw_attrs():
     if not os.path.exists(path):
         return {}
     result = {}
-    xls = pd.ExcelFile(path)
-    for sheet in xls.sheet_names:
-        df = pd.read_excel(xls, sheet_name=sheet, dtype=str)
+    # One read for every sheet; openpyxl parsing holds the GIL, so threads don't help
+    sheets = pd.read_excel(path, sheet_name=None, dtype=str)
+    for df in sheets.values():
         df.columns = [c.strip() for c in df.columns]
         sku_col = "SKU" if "SKU" in df.columns else None
         if not sku_col:
@@ -370,18 +354,72 @@ def _load_google_raw_attrs():
                     break
         if not sku_col:
             continue
-        for _, row in df.iterrows():
-            sku = str(row.get(sku_col, "")).strip().upper()
-            if not sku or sku == "NAN":
-                continue
-            result[sku] = {
-                "weight_lb": row.get("Weight (lb)", ""),
-                "shipping_weight_lb": row.get("Shipping Weight (lb)/NA",
-                                     row.get("Shipping Weight (lb)", "")),
-                "dimensions": f"{row.get('Shipping Length (in)/NA', row.get('Shipping Length (in)', ''))} x "
-                             f"{row.get('Shipping Width (in)/NA', row.get('Shipping Width (in)', ''))} x "
-                             f"{row.get('Shipping Height (in)/NA', row.get('Shipping Height (in)', ''))}",
-            }
+        empty = pd.Series("", index=df.index)
+        length = df.get("Shipping Length (in)/NA", df.get("Shipping Length (in)", empty))
+        width = df.get("Shipping Width (in)/NA", df.get("Shipping Width (in)", empty))
+        height = df.get("Shipping Height (in)/NA", df.get("Shipping Height (in)", empty))
+        attrs = pd.DataFrame({
+            "sku": df[sku_col].fillna("").str.strip().str.upper(),
+            "weight_lb": df.get("Weight (lb)", empty),
+            "shipping_weight_lb": df.get("Shipping Weight (lb)/NA",
+                                         df.get("Shipping Weight (lb)", empty)),
+            "dimensions": (length.fillna("") + " x " + width.fillna("") + " x " + height.fillna("")),
+        })
+        attrs = attrs[(attrs["sku"] != "") & (attrs["sku"] != "NAN")]
+        attrs = attrs.drop_duplicates(subset="sku", keep="last")
+        result.update(attrs.set_index("sku").to_dict("index"))
+    return result
+
+
+# Part of every compare-cache key — bump it when merge_by_sku or a find_* function
+# changes, so results pickled by the old code are recomputed instead of reused
+CACHE_VERSION = 1
+
+
+def _sources_fingerprint(sources):
+    """Content hash of every loaded source, stable across runs."""
+    return tuple(
+        (name, tuple(df.columns), int(pd.util.hash_pandas_object(df, index=False).sum()))
+        for name, df in sorted(sources.items())
+    )
+
+
+def file_stamp(path):
+    """(mtime, size) of a raw data file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def load_cache(file_name):
+    """Load a cache dict pickled to DATA_DIR/file_name by the previous run ({} if absent or unreadable)."""
+    cache_path = os.path.join(config.DATA_DIR, file_name)
+    if not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return {}
+
+
+def save_cache(file_name, cache):
+    """Pickle a cache dict to DATA_DIR/file_name."""
+    os.makedirs(config.DATA_DIR, exist_ok=True)
+    cache_path = os.path.join(config.DATA_DIR, file_name)
+    with open(cache_path, "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def cached(cache, name, key, func, *args):
+    """Return cache[name] if it was computed from the same inputs (key), else recompute and store it."""
+    hit = cache.get(name)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    result = func(*args)
+    cache[name] = (key, result)
     return result
 
 
@@ -389,23 +427,42 @@ def compare_all(sources):
     """
     Full comparison of all sources.
     Returns a dict with results.
+
+    Each result is cached against CACHE_VERSION and a hash of the loaded sources
+    (plus the settings and raw files it depends on), so unchanged inputs skip the work.
     """
     print("\n2. Comparing data...")
-    merged = merge_by_sku(sources)
+    cache = load_cache("compare_cache.pkl")
+    fingerprint = (CACHE_VERSION, _sources_fingerprint(sources))
+    raw_files = tuple(file_stamp(p) for p in (
+        os.path.join(config.DATA_DIR, "zoho_api_cache.json"),
+        config.WEBSITE_CSV,
+        config.GOOGLE_XLSX,
+    ))
+
+    merged = cached(cache, "merged", fingerprint, merge_by_sku, sources)
     print(f"   Total unique SKUs: {len(merged)}")
 
-    missing = find_missing(merged, sources)
+    missing = cached(cache, "missing", fingerprint, find_missing, merged, sources)
     print(f"   Products with gaps: {len(missing)}")
 
-    price_diff = find_price_differences(merged, sources)
+    price_key = (fingerprint, config.PRICE_TOLERANCE, config.PRICE_TOLERANCE_PERCENT)
+    price_diff = cached(cache, "price_differences", price_key,
+                        find_price_differences, merged, sources)
     print(f"   Price discrepancies: {len(price_diff)}")
 
-    name_diff = find_name_differences(merged, sources)
+    name_key = (fingerprint, config.FUZZY_MATCH_THRESHOLD)
+    name_diff = cached(cache, "name_differences", name_key,
+                       find_name_differences, merged, sources)
     print(f"   Name discrepancies: {len(name_diff)}")
 
-    attr_diff = find_attribute_differences(merged, sources)
+    attr_key = (fingerprint, raw_files)
+    attr_diff = cached(cache, "attribute_differences", attr_key,
+                       find_attribute_differences, merged, sources)
     print(f"   Attribute discrepancies: {len(attr_diff)}")
 
+    save_cache("compare_cache.pkl", cache)
+
     return {
         "merged": merged,
         "missing": missing,
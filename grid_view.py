@@ -5,8 +5,10 @@ Highlights what's present, missing, or mismatched.
 """
 
 import os
-import json
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 import config
 import name_parser
@@ -82,6 +84,62 @@ DATA_ONLY_ATTRS = {
     "Rear Ear to Ear",
 }
 
+# Source attribute names to try, in order, for a grid column.
+SOURCE_ALIASES = {
+    "Bucket Size": ["Bucket Size (in)", "Bucket Size (in)/Filter",
+                    "Product Width (in)",
+                    "Rake Size", "Rake Width (in)", "Width (in)",
+                    "Grapple Width (in)", "Grapple Size", "Grapple Width",
+                    "Broom Width (in)", "Broom Size", "Brush Size",
+                    "Compaction Width", "Fork Size", "Saw Length"],
+    "Pin Size": ["Front Pin Diameter (mm)", "Front Pin Diameter",
+                 "Pin Diameter (mm)", "Pin size", "Front Pin Size"],
+    "Front Pin Diameter (mm)": ["Front Pin Diameter", "Pin Size",
+                                 "Pin Diameter (mm)", "Pin size", "Front Pin Size"],
+    "Rear Pin Diameter (mm)": ["Rear Pin Diameter", "Rear Pin Diameter (mm)/Filter",
+                                "Rear Pin Size (mm)", "Back Pin Size (mm)"],
+    "Rear Ear to Ear": ["Rear Ear to Ear (mm)", "Rear Ear to Ear Distance",
+                         "Back Ear to Ear"],
+    "Carrier Weight Class": ["Carrier Weight Class (tn)", "Carrier Weight Class "],
+    "Head Style": ["Coupler Head Type", "Head Style", "Coupler Type", "Coupler Type/Filter",
+                   "Head Type"],
+    "Machine Type": ["Machine Type"],
+    "Product Capacity (yds)": ["Capacity (yd³)", "Capacity (yd³)/Filter",
+                                "Capacity ($yd^3$)", "Capacity (yds)"],
+    "Capacity (m³)": ["Capacity (m³)", "Capacity ($m^3$)", "Capacity (m3)"],
+    "Attachment Types": ["Attachment Types/NA"],
+    "Bucket Type": ["Category", "Category/NA"],
+    "Category": ["Bucket Type"],
+    "Product Weight (lbs)": ["Weight (lb)", "Weight (lbs)", "Rake Weight (lb)"],
+    "Product Weight (kg)": ["Weight (kg)", "Rake Weight (kg)"],
+    "Diameter (mm)": ["Chisel Bit Size", "Chisel Bit Diameter (mm)",
+                      "Bit Diameter (mm)", "Pin Diameter (mm)"],
+    "Outer Diameter": ["Outer Diameter (mm)/Filter", "Outer Diameter (mm)"],
+    "Interior Diameter": ["Interior Diameter (mm)/Filter", "Interior Diameter (mm)"],
+    "Thickness": ["Height (mm)/Filter", "Height (mm)", "Thickness (mm)"],
+}
+
+
+# Trailing "(unit)" on an attribute name, e.g. "Pin Diameter (mm)"
+_ATTR_UNIT_RE = re.compile(r'\s*\([^)]*\)\s*$')
+
+# Per-product columns of a category grid, followed by one group per attribute
+GRID_BASE_COLUMNS = [
+    "SKU", "Zoho Status", "Zoho Name", "Zoho Title", "Website Name", "Google Name",
+    "Zoho Price", "Website Price", "In Website", "In Google",
+]
+GRID_SUFFIXES = ["[Name]", "[Zoho]", "[Web]", "[Google]", "[Status]"]
+STATUS_DTYPE = pd.CategoricalDtype(categories=["", "OK", "MISMATCH", "PARTIAL"])
+
+# Catalog size (active Zoho products) from which build_grid uses worker processes
+PARALLEL_MIN_PRODUCTS = 5000
+
+# Shared default for SKUs missing from a source — never modified
+_EMPTY = {}
+
+# Zoho item fields used by build_grid
+_ZOHO_GRID_FIELDS = ("name", "status", "rate", "category_name")
+
 
 def build_grid():
     """
@@ -98,27 +156,31 @@ def build_grid():
 
     # Load zoho cache for price/status — exclude inactive items
     zoho_cache = {}
-    cache_path = os.path.join(config.DATA_DIR, "zoho_api_cache.json")
-    if os.path.exists(cache_path):
-        with open(cache_path, "r", encoding="utf-8") as f:
-            for item in json.load(f):
-                if str(item.get("status", "")).lower() == "inactive":
-                    continue
-                sku = str(item.get("sku", "")).strip().upper()
-                if sku:
-                    zoho_cache[sku] = item
+    for item in name_parser._load_zoho_items():
+        if str(item.get("status", "")).lower() == "inactive":
+            continue
+        sku = str(item.get("sku", "")).strip().upper()
+        if sku:
+            # Keep only the fields the grid shows, not the whole API record
+            zoho_cache[sku] = {k: item[k] for k in _ZOHO_GRID_FIELDS if k in item}
 
     # Load website names/prices
     web_products = {}
     if os.path.exists(config.WEBSITE_CSV):
-        df = pd.read_csv(config.WEBSITE_CSV, dtype=str, low_memory=False)
-        for _, row in df.iterrows():
-            sku = str(row.get("SKU", "")).strip().upper()
-            if sku:
-                web_products[sku] = {
-                    "name": row.get("Name", ""),
-                    "price": row.get("Regular price", ""),
-                }
+        # Only the three columns we use, a chunk at a time
+        chunks = pd.read_csv(config.WEBSITE_CSV, dtype=str, chunksize=50_000,
+                             usecols=lambda c: c in ("SKU", "Name", "Regular price"))
+        for chunk in chunks:
+            if "SKU" not in chunk.columns:
+                break
+            sku = chunk["SKU"].fillna("").str.strip().str.upper()
+            names = chunk["Name"] if "Name" in chunk.columns else pd.Series("", index=chunk.index)
+            prices = chunk["Regular price"] if "Regular price" in chunk.columns else pd.Series("", index=chunk.index)
+            web_products.update(
+                (s, {"name": n, "price": p})
+                for s, n, p in zip(sku, names, prices)
+                if s
+            )
 
     # Group ALL Zoho products by category (not just those with website title)
     categories = {}
@@ -128,185 +190,237 @@ def build_grid():
             categories[cat] = []
         categories[cat].append(sku)
 
-    # Build grid per category
-    grids = {}
+    # Build grid per category. Categories are independent, so large catalogs
+    # fan out to worker processes; each gets only its own SKUs' data.
+    jobs = []
     for cat in sorted(categories.keys()):
         skus = sorted(categories[cat])
         if not skus:
             continue
+        jobs.append((
+            cat, skus,
+            _slice(zoho_titles, skus), _slice(zoho_attrs, skus),
+            _slice(web_attrs, skus), _slice(google_attrs, skus),
+            _slice(zoho_cache, skus), _slice(web_products, skus),
+        ))
+
+    if len(jobs) > 1 and len(zoho_cache) >= PARALLEL_MIN_PRODUCTS:
+        with ProcessPoolExecutor() as ex:
+            results = list(ex.map(_build_category_grid, *zip(*jobs)))
+    else:
+        results = [_build_category_grid(*job) for job in jobs]
+
+    grids = {job[0]: grid for job, grid in zip(jobs, results)}
+    return grids
 
-        # Determine relevant attributes for this category
-        attr_keys = [a for a in COMMON_ATTRS if not (a == "Bucket Size" and cat in NO_BUCKET_SIZE)]
-        if cat in CATEGORY_ATTRS:
-            attr_keys = CATEGORY_ATTRS[cat] + attr_keys
-
-        # Collect all unique attribute keys from all sources for this category
-        all_zoho_keys = set()
-        all_web_keys = set()
-        all_google_keys = set()
-        for sku in skus:
-            if sku in zoho_attrs:
-                all_zoho_keys.update(zoho_attrs[sku].keys())
-            if sku in web_attrs:
-                all_web_keys.update(web_attrs[sku].keys())
-            if sku in google_attrs:
-                all_google_keys.update(google_attrs[sku].keys())
-
-        # Add source-specific attrs that aren't already covered
-        extra_zoho = _filter_important_attrs(all_zoho_keys, attr_keys)
-        extra_web = _filter_important_attrs(all_web_keys, attr_keys)
-        extra_google = _filter_important_attrs(all_google_keys, attr_keys)
-
-        # Build unified list of attribute columns — deduplicate by base name (including substrings)
-        all_attr_names = list(dict.fromkeys(attr_keys))  # preserve order, unique
-        covered_bases = {_attr_base(a) for a in all_attr_names}
-        for a in extra_zoho + extra_web + extra_google:
-            base = _attr_base(a)
-            if a not in all_attr_names and not any(
-                cb == base or cb in base or base in cb
-                for cb in covered_bases
-            ):
-                all_attr_names.append(a)
-                covered_bases.add(base)
-
-        rows = []
-        for sku in skus:
-            zoho_data = zoho_titles.get(sku, {})
-            title = zoho_data.get("website_title", "")
-            if not title or not title.strip():
-                continue
-            parsed = name_parser.parse_name(title, cat)
-
-            zoho_item = zoho_cache.get(sku, {})
-            web_prod = web_products.get(sku, {})
-
-            # Google product name
-            google_name = ""
-            g_attrs = google_attrs.get(sku, {})
-            for key in ["Variation Name", "Variation Name/NA", "Product Name", "Name"]:
-                if key in g_attrs:
-                    google_name = g_attrs[key]
-                    break
-
-            zoho_status = str(zoho_item.get("status", "")).capitalize()
-
-            row = {
-                "SKU": sku,
-                "Zoho Status": zoho_status,
-                "Zoho Name": str(zoho_item.get("name", ""))[:80],
-                "Zoho Title": title[:80] if title else "",
-                "Website Name": str(web_prod.get("name", ""))[:80],
-                "Google Name": str(google_name)[:80],
-                "Zoho Price": zoho_item.get("rate", ""),
-                "Website Price": web_prod.get("price", ""),
-                "In Website": "Yes" if sku in web_attrs else "No",
-                "In Google": "Yes" if sku in google_attrs else "No",
-            }
-
-            for attr_name in all_attr_names:
-                # Value from parsed name
-                name_val = _find_parsed_value(parsed, attr_name)
-
-                # Value from Zoho attributes
-                zoho_val = _find_source_value(zoho_attrs.get(sku, {}), attr_name)
-
-                # Value from website
-                web_val = _find_source_value(web_attrs.get(sku, {}), attr_name)
-
-                # Value from google
-                google_val = _find_source_value(google_attrs.get(sku, {}), attr_name)
-
-                row[f"{attr_name} [Name]"] = name_val
-                row[f"{attr_name} [Zoho]"] = zoho_val
-                row[f"{attr_name} [Web]"] = web_val
-                row[f"{attr_name} [Google]"] = google_val
-
-                # Status — for data-only attrs, ignore name value in evaluation
-                if attr_name in DATA_ONLY_ATTRS:
-                    vals = [v for v in [zoho_val, web_val, google_val] if v]
-                else:
-                    vals = [v for v in [name_val, zoho_val, web_val, google_val] if v]
-                if not vals:
-                    row[f"{attr_name} [Status]"] = ""
-                elif len(vals) == 1:
-                    row[f"{attr_name} [Status]"] = "PARTIAL"
-                else:
-                    # Check if all non-empty values match
-                    match = _all_match(vals)
-                    row[f"{attr_name} [Status]"] = "OK" if match else "MISMATCH"
-
-            rows.append(row)
-
-        df = pd.DataFrame(rows)
-
-        # Drop attribute columns where ALL 4 value sub-columns are empty across every row
-        non_empty_attrs = []
-        for attr in all_attr_names:
-            has_data = any(
-                df[f"{attr} {suffix}"].apply(
-                    lambda x: bool(str(x).strip()) and str(x) not in ("", "nan")
-                ).any()
-                for suffix in ["[Name]", "[Zoho]", "[Web]", "[Google]"]
-                if f"{attr} {suffix}" in df.columns
-            )
-            if has_data:
-                non_empty_attrs.append(attr)
 
-        grids[cat] = {
-            "data": df,
-            "attr_names": non_empty_attrs,
-        }
+def _slice(data, skus):
+    """Subset of a {sku: ...} dict for the given SKUs."""
+    return {sku: data[sku] for sku in skus if sku in data}
+
+
+def _build_category_grid(cat, skus, zoho_titles, zoho_attrs, web_attrs, google_attrs,
+                         zoho_cache, web_products):
+    """Build one category's grid: {"data": DataFrame, "attr_names": [...]}."""
+    # Determine relevant attributes for this category
+    attr_keys = [a for a in COMMON_ATTRS if not (a == "Bucket Size" and cat in NO_BUCKET_SIZE)]
+    if cat in CATEGORY_ATTRS:
+        attr_keys = CATEGORY_ATTRS[cat] + attr_keys
+
+    # Collect all unique attribute keys from all sources for this category
+    all_zoho_keys = set().union(*(zoho_attrs[s].keys() for s in skus if s in zoho_attrs))
+    all_web_keys = set().union(*(web_attrs[s].keys() for s in skus if s in web_attrs))
+    all_google_keys = set().union(*(google_attrs[s].keys() for s in skus if s in google_attrs))
+
+    # Add source-specific attrs that aren't already covered
+    extra_zoho = _filter_important_attrs(all_zoho_keys, attr_keys)
+    extra_web = _filter_important_attrs(all_web_keys, attr_keys)
+    extra_google = _filter_important_attrs(all_google_keys, attr_keys)
+
+    # Build unified list of attribute columns — deduplicate by base name (including substrings)
+    all_attr_names = list(dict.fromkeys(attr_keys))  # preserve order, unique
+    covered_bases = {_attr_base(a) for a in all_attr_names}
+    for a in extra_zoho + extra_web + extra_google:
+        base = _attr_base(a)
+        if a not in all_attr_names and not _overlaps(base, covered_bases):
+            all_attr_names.append(a)
+            covered_bases.add(base)
+
+    # Columnar build: one list per output column, appended in lockstep
+    columns = {h: [] for h in GRID_BASE_COLUMNS}
+    attr_columns = []
+    for attr_name in all_attr_names:
+        cols = tuple([] for _ in GRID_SUFFIXES)
+        columns.update(zip((f"{attr_name} {s}" for s in GRID_SUFFIXES), cols))
+        attr_columns.append((attr_name, cols))
+
+    for sku in skus:
+        zoho_data = zoho_titles.get(sku, _EMPTY)
+        title = zoho_data.get("website_title", "")
+        if not title or not title.strip():
+            continue
+        parsed = name_parser.parse_name(title, cat)
+        zoho_sku = zoho_attrs.get(sku, _EMPTY)
+        web_sku = web_attrs.get(sku, _EMPTY)
+        google_sku = google_attrs.get(sku, _EMPTY)
+        # Lowercase each source's keys once per SKU, not once per attribute
+        parsed_lc = _lowered(parsed)
+        zoho_lc = _lowered(zoho_sku)
+        web_lc = _lowered(web_sku)
+        google_lc = _lowered(google_sku)
+
+        zoho_item = zoho_cache.get(sku, _EMPTY)
+        web_prod = web_products.get(sku, _EMPTY)
+
+        # Google product name
+        google_name = ""
+        for key in ["Variation Name", "Variation Name/NA", "Product Name", "Name"]:
+            if key in google_sku:
+                google_name = google_sku[key]
+                break
 
-    return grids
+        zoho_status = str(zoho_item.get("status", "")).capitalize()
+
+        base = (
+            sku,
+            zoho_status,
+            str(zoho_item.get("name", ""))[:80],
+            title[:80] if title else "",
+            str(web_prod.get("name", ""))[:80],
+            str(google_name)[:80],
+            zoho_item.get("rate", ""),
+            web_prod.get("price", ""),
+            "Yes" if sku in web_attrs else "No",
+            "Yes" if sku in google_attrs else "No",
+        )
+        for h, v in zip(GRID_BASE_COLUMNS, base):
+            columns[h].append(v)
+
+        for attr_name, (name_col, zoho_col, web_col, google_col, status_col) in attr_columns:
+            # Value from parsed name
+            name_val = _find_parsed_value(parsed, attr_name, parsed_lc)
+
+            # Value from Zoho attributes
+            zoho_val = _find_source_value(zoho_sku, attr_name, zoho_lc)
+
+            # Value from website
+            web_val = _find_source_value(web_sku, attr_name, web_lc)
+
+            # Value from google
+            google_val = _find_source_value(google_sku, attr_name, google_lc)
+
+            name_col.append(name_val)
+            zoho_col.append(zoho_val)
+            web_col.append(web_val)
+            google_col.append(google_val)
+
+            # Status — for data-only attrs, ignore name value in evaluation
+            if attr_name in DATA_ONLY_ATTRS:
+                vals = [v for v in [zoho_val, web_val, google_val] if v]
+            else:
+                vals = [v for v in [name_val, zoho_val, web_val, google_val] if v]
+            if not vals:
+                status_col.append("")
+            elif len(vals) == 1:
+                status_col.append("PARTIAL")
+            else:
+                # Check if all non-empty values match
+                match = _all_match(vals)
+                status_col.append("OK" if match else "MISMATCH")
+
+    df = pd.DataFrame(columns)
+    # Small fixed vocabularies — store as categoricals (int codes, cheap equality)
+    status_cols = [f"{a} [Status]" for a in all_attr_names]
+    df[status_cols] = df[status_cols].astype(STATUS_DTYPE)
+    df["Zoho Status"] = df["Zoho Status"].astype("category")
+
+    # Drop attribute columns where ALL 4 value sub-columns are empty across every row
+    value_cols = [
+        f"{attr} {suffix}"
+        for attr in all_attr_names
+        for suffix in ["[Name]", "[Zoho]", "[Web]", "[Google]"]
+        if f"{attr} {suffix}" in df.columns
+    ]
+    text = df[value_cols].to_numpy(dtype=str)
+    filled = ((np.char.strip(text) != "") & (text != "nan")).any(axis=0)
+    cols_with_data = {col for col, has in zip(value_cols, filled) if has}
+    non_empty_attrs = [
+        attr for attr in all_attr_names
+        if any(f"{attr} {suffix}" in cols_with_data
+               for suffix in ["[Name]", "[Zoho]", "[Web]", "[Google]"])
+    ]
+
+    return {
+        "data": df,
+        "attr_names": non_empty_attrs,
+    }
 
 
+@lru_cache(maxsize=4096)
 def _attr_base(key):
     """Strip trailing (unit) and normalize for dedup comparison."""
-    return re.sub(r'\s*\([^)]*\)\s*$', '', key).strip().lower()
+    return _ATTR_UNIT_RE.sub('', key).strip().lower()
+
+
+# Source keys containing any of these (case-insensitive) are noise in the grid
+_SKIP_PATTERNS = [p.lower() for p in [
+    "Variation Name", "Category", "Handling Unit", "Unit",
+    "Shipping Length", "Shipping Width", "Shipping Height",
+    "Shipping Weight", "Weight (lb)", "Weight (kg)",
+    "Product Name", "Name",
+    # Handled via Bucket Size alias — avoid duplicate column
+    "Product Width (in)", "Product Width (mm)",
+    # Handled via Capacity aliases
+    "Capacity (yd", "Capacity ($yd",
+    # Duplicates — already covered by Head Style column
+    "Coupler Head Type", "Coupler Type",
+    # Duplicate — already covered by Product Type
+    "Bucket Type",
+    # Handled via Diameter (mm) — avoid duplicate column
+    "Chisel Bit Size", "Bit Diameter",
+]]
+
+
+def _overlaps(base, covered_bases):
+    """True if base contains, or is contained in, any already covered base."""
+    return any(cb in base or base in cb for cb in covered_bases)
 
 
 def _filter_important_attrs(all_keys, already_covered):
     """Filter to important/interesting attributes, skip noise."""
-    skip_patterns = [
-        "Variation Name", "Category", "Handling Unit", "Unit",
-        "Shipping Length", "Shipping Width", "Shipping Height",
-        "Shipping Weight", "Weight (lb)", "Weight (kg)",
-        "Product Name", "Name",
-        # Handled via Bucket Size alias — avoid duplicate column
-        "Product Width (in)", "Product Width (mm)",
-        # Handled via Capacity aliases
-        "Capacity (yd", "Capacity ($yd",
-        # Duplicates — already covered by Head Style column
-        "Coupler Head Type", "Coupler Type",
-        # Duplicate — already covered by Product Type
-        "Bucket Type",
-        # Handled via Diameter (mm) — avoid duplicate column
-        "Chisel Bit Size", "Bit Diameter",
-    ]
+    # Bases are computed once per key; covered ones grow as keys are accepted
+    covered_bases = [_attr_base(a) for a in already_covered]
     result = []
     for key in sorted(all_keys):
-        if any(p.lower() in key.lower() for p in skip_patterns):
+        key_lower = key.lower()
+        if any(p in key_lower for p in _SKIP_PATTERNS):
             continue
         base = _attr_base(key)
         # Check if it's already covered by our common attrs or result so far
-        covered = False
-        for existing in list(already_covered) + result:
-            existing_base = _attr_base(existing)
-            if existing_base == base or existing_base in base or base in existing_base:
-                covered = True
-                break
-        if not covered:
+        if not _overlaps(base, covered_bases):
             result.append(key)
-    return result[:15]  # Limit to avoid too many columns
+            covered_bases.append(base)
+            if len(result) == 15:  # Limit to avoid too many columns
+                break
+    return result
+
 
+def _lowered(attrs):
+    """(lowercased key, value) pairs of an attribute dict, in insertion order."""
+    return [(k.lower(), v) for k, v in attrs.items()]
 
-def _find_parsed_value(parsed, attr_name):
-    """Find value in parsed dict, matching by name or ATTR_MAP reverse lookup."""
+
+def _find_parsed_value(parsed, attr_name, lowered=None):
+    """Find value in parsed dict, matching by name or ATTR_MAP reverse lookup.
+
+    lowered is _lowered(parsed), passed in when the same dict is queried repeatedly.
+    """
     if attr_name in parsed:
         return parsed[attr_name]
     # Fuzzy key match
-    for k, v in parsed.items():
-        if k.lower() in attr_name.lower() or attr_name.lower() in k.lower():
+    attr_lower = attr_name.lower()
+    for k, v in (lowered if lowered is not None else _lowered(parsed)):
+        if k in attr_lower or attr_lower in k:
             return v
     # Reverse ATTR_MAP lookup: if attr_name appears in a parsed key's alias list,
     # return that parsed key's value.
@@ -317,52 +431,19 @@ def _find_parsed_value(parsed, attr_name):
     return ""
 
 
-def _find_source_value(attrs, attr_name):
-    """Find value in source attributes dict."""
+def _find_source_value(attrs, attr_name, lowered=None):
+    """Find value in source attributes dict (lowered as in _find_parsed_value)."""
     if not attrs:
         return ""
     if attr_name in attrs:
         return attrs[attr_name]
     # Try partial match
     attr_lower = attr_name.lower()
-    for k, v in attrs.items():
-        if attr_lower in k.lower() or k.lower() in attr_lower:
+    for k, v in (lowered if lowered is not None else _lowered(attrs)):
+        if attr_lower in k or k in attr_lower:
             return v
     # Map common aliases
-    aliases = {
-        "Bucket Size": ["Bucket Size (in)", "Bucket Size (in)/Filter",
-                        "Product Width (in)",
-                        "Rake Size", "Rake Width (in)", "Width (in)",
-                        "Grapple Width (in)", "Grapple Size", "Grapple Width",
-                        "Broom Width (in)", "Broom Size", "Brush Size",
-                        "Compaction Width", "Fork Size", "Saw Length"],
-        "Pin Size": ["Front Pin Diameter (mm)", "Front Pin Diameter",
-                     "Pin Diameter (mm)", "Pin size", "Front Pin Size"],
-        "Front Pin Diameter (mm)": ["Front Pin Diameter", "Pin Size",
-                                     "Pin Diameter (mm)", "Pin size", "Front Pin Size"],
-        "Rear Pin Diameter (mm)": ["Rear Pin Diameter", "Rear Pin Diameter (mm)/Filter",
-                                    "Rear Pin Size (mm)", "Back Pin Size (mm)"],
-        "Rear Ear to Ear": ["Rear Ear to Ear (mm)", "Rear Ear to Ear Distance",
-                             "Back Ear to Ear"],
-        "Carrier Weight Class": ["Carrier Weight Class (tn)", "Carrier Weight Class "],
-        "Head Style": ["Coupler Head Type", "Head Style", "Coupler Type", "Coupler Type/Filter",
-                       "Head Type"],
-        "Machine Type": ["Machine Type"],
-        "Product Capacity (yds)": ["Capacity (yd³)", "Capacity (yd³)/Filter",
-                                    "Capacity ($yd^3$)", "Capacity (yds)"],
-        "Capacity (m³)": ["Capacity (m³)", "Capacity ($m^3$)", "Capacity (m3)"],
-        "Attachment Types": ["Attachment Types/NA"],
-        "Bucket Type": ["Category", "Category/NA"],
-        "Category": ["Bucket Type"],
-        "Product Weight (lbs)": ["Weight (lb)", "Weight (lbs)", "Rake Weight (lb)"],
-        "Product Weight (kg)": ["Weight (kg)", "Rake Weight (kg)"],
-        "Diameter (mm)": ["Chisel Bit Size", "Chisel Bit Diameter (mm)",
-                          "Bit Diameter (mm)", "Pin Diameter (mm)"],
-        "Outer Diameter": ["Outer Diameter (mm)/Filter", "Outer Diameter (mm)"],
-        "Interior Diameter": ["Interior Diameter (mm)/Filter", "Interior Diameter (mm)"],
-        "Thickness": ["Height (mm)/Filter", "Height (mm)", "Thickness (mm)"],
-    }
-    for alias in aliases.get(attr_name, []):
+    for alias in SOURCE_ALIASES.get(attr_name, []):
         if alias in attrs:
             return attrs[alias]
     return ""
@@ -375,6 +456,11 @@ def _all_match(values):
     cleaned = [v for v in values if v and str(v).strip()]
     if len(cleaned) < 2:
         return True
+    # Values with the same (non-empty) normalized form always match each other —
+    # the common case, decided with one normalization per value
+    canonical = {name_parser._normalize_value(v) for v in cleaned}
+    if len(canonical) == 1 and "" not in canonical:
+        return True
     # Check all pairs against each other
     for i in range(len(cleaned)):
         for j in range(i + 1, len(cleaned)):
@@ -393,14 +479,33 @@ def generate_grid_html(grids, output_path=None):
     total_mismatches = 0
     total_partial = 0
     for g in grids.values():
-        for col in g["data"].columns:
-            if col.endswith("[Status]"):
-                total_mismatches += (g["data"][col] == "MISMATCH").sum()
-                total_partial += (g["data"][col] == "PARTIAL").sum()
+        statuses = g["data"].filter(regex=r"\[Status\]$").to_numpy()
+        total_mismatches += int((statuses == "MISMATCH").sum())
+        total_partial += int((statuses == "PARTIAL").sum())
 
     cat_list = sorted(grids.keys(), key=lambda c: -len(grids[c]["data"]))
 
-    html = f"""<!DOCTYPE html>
+    # Stream the page straight to disk instead of holding it all in memory
+    with open(output_path, "w", encoding="utf-8") as f:
+        _write_grid_page(f.write, grids, cat_list, total_products, total_mismatches, total_partial)
+
+    print(f"  Attribute grid: {output_path}")
+
+    # Flat copy of every category's grid for spreadsheets / downstream scripts
+    csv_path = os.path.splitext(output_path)[0] + ".csv"
+    frames = [g["data"].assign(Category=cat) for cat, g in grids.items() if len(g["data"])]
+    if frames:
+        flat = pd.concat(frames, ignore_index=True)
+        flat = flat[["Category"] + [c for c in flat.columns if c != "Category"]]
+        flat.to_csv(csv_path, index=False, encoding="utf-8")
+        print(f"  Attribute grid data: {csv_path}")
+
+    return output_path
+
+
+def _write_grid_page(write, grids, cat_list, total_products, total_mismatches, total_partial):
+    """Write the attribute grid page fragment by fragment through write()."""
+    write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
@@ -552,14 +657,14 @@ def generate_grid_html(grids, output_path=None):
   </div>
 
   <div class="cat-nav">
-"""
+""")
 
     for cat in cat_list:
         cnt = len(grids[cat]["data"])
         safe_id = re.sub(r'[^a-zA-Z0-9]', '', cat)
-        html += f'    <a class="cat-btn" href="#{safe_id}" onclick="expandCat(\'{safe_id}\')">{_esc(cat)}<span class="cnt">{cnt}</span></a>\n'
+        write(f'    <a class="cat-btn" href="#{safe_id}" onclick="expandCat(\'{safe_id}\')">{_esc(cat)}<span class="cnt">{cnt}</span></a>\n')
 
-    html += '  </div>\n'
+    write('  </div>\n')
 
     # Category sections
     for cat in cat_list:
@@ -569,107 +674,66 @@ def generate_grid_html(grids, output_path=None):
         safe_id = re.sub(r'[^a-zA-Z0-9]', '', cat)
 
         # Count issues in this category
-        cat_mismatches = 0
-        for a in attr_names:
-            col = f"{a} [Status]"
-            if col in df.columns:
-                cat_mismatches += (df[col] == "MISMATCH").sum()
-
-        html += f'\n  <div class="cat-section" id="{safe_id}">\n'
-        html += f'    <div class="cat-header" onclick="toggleCat(\'{safe_id}\')">{_esc(cat)} <span class="cnt">{len(df)} products</span>'
+        status_cols = [f"{a} [Status]" for a in attr_names if f"{a} [Status]" in df.columns]
+        cat_mismatches = int((df[status_cols].to_numpy() == "MISMATCH").sum())
+
+        write(f'\n  <div class="cat-section" id="{safe_id}">\n')
+        write(f'    <div class="cat-header" onclick="toggleCat(\'{safe_id}\')">{_esc(cat)} <span class="cnt">{len(df)} products</span>')
         if cat_mismatches:
-            html += f' <span style="color:var(--red);font-size:0.8rem;">{cat_mismatches} mismatches</span>'
-        html += ' <span class="toggle">▶ expand</span></div>\n'
-        html += '    <div class="cat-body">\n'
-        html += '    <div class="grid-wrap">\n'
-        html += f'      <div class="search"><input type="text" placeholder="Search in {_esc(cat)}..." onkeyup="filterCat(this,\'{safe_id}\')">'
-        html += f' <button class="filter-btn" onclick="toggleMismatch(this,\'{safe_id}\')">Mismatch Only</button>'
-        html += f'</div>\n'
-        html += '      <div class="grid-scroll">\n'
-        html += '        <table>\n'
+            write(f' <span style="color:var(--red);font-size:0.8rem;">{cat_mismatches} mismatches</span>')
+        write(' <span class="toggle">▶ expand</span></div>\n')
+        write('    <div class="cat-body">\n')
+        write('    <div class="grid-wrap">\n')
+        write(f'      <div class="search"><input type="text" placeholder="Search in {_esc(cat)}..." onkeyup="filterCat(this,\'{safe_id}\')">')
+        write(f' <button class="filter-btn" onclick="toggleMismatch(this,\'{safe_id}\')">Mismatch Only</button>')
+        write(f'</div>\n')
+        write('      <div class="grid-scroll">\n')
+        write('        <table>\n')
 
         # Header row 1: attribute group names
-        html += '          <thead>\n'
-        html += '          <tr>\n'
-        html += '            <th rowspan="2" class="sticky-col sticky-col-0">SKU</th>\n'
-        html += '            <th rowspan="2" class="sticky-col sticky-col-1">Zoho Title (website)</th>\n'
-        html += '            <th rowspan="2">Status</th>\n'
-        html += '            <th rowspan="2">Website Name</th>\n'
-        html += '            <th rowspan="2">Google Name</th>\n'
-        html += '            <th rowspan="2">In Web</th>\n'
-        html += '            <th rowspan="2">In Google</th>\n'
+        write(
+            '          <thead>\n'
+            '          <tr>\n'
+            '            <th rowspan="2" class="sticky-col sticky-col-0">SKU</th>\n'
+            '            <th rowspan="2" class="sticky-col sticky-col-1">Zoho Title (website)</th>\n'
+            '            <th rowspan="2">Status</th>\n'
+            '            <th rowspan="2">Website Name</th>\n'
+            '            <th rowspan="2">Google Name</th>\n'
+            '            <th rowspan="2">In Web</th>\n'
+            '            <th rowspan="2">In Google</th>\n'
+        )
 
         for attr in attr_names:
-            html += f'            <th class="attr-group" colspan="5">{_esc(attr)}</th>\n'
+            write(f'            <th class="attr-group" colspan="5">{_esc(attr)}</th>\n')
 
-        html += '          </tr>\n'
+        write('          </tr>\n')
 
         # Header row 2: sub-columns (Name, Zoho, Web, Google, Status)
-        html += '          <tr>\n'
+        write('          <tr>\n')
         for attr in attr_names:
-            html += '            <th class="sub sub-name">Parsed</th>\n'
-            html += '            <th class="sub sub-zoho">Zoho</th>\n'
-            html += '            <th class="sub sub-web">Web</th>\n'
-            html += '            <th class="sub sub-google">Google</th>\n'
-            html += '            <th class="sub">St</th>\n'
-        html += '          </tr>\n'
-        html += '          </thead>\n'
+            write('            <th class="sub sub-name">Parsed</th>\n')
+            write('            <th class="sub sub-zoho">Zoho</th>\n')
+            write('            <th class="sub sub-web">Web</th>\n')
+            write('            <th class="sub sub-google">Google</th>\n')
+            write('            <th class="sub">St</th>\n')
+        write('          </tr>\n')
+        write('          </thead>\n')
 
         # Data rows
-        html += '          <tbody>\n'
-        for _, row in df.iterrows():
-            has_mismatch = any(
-                str(row.get(f"{a} [Status]", "")) == "MISMATCH"
-                for a in attr_names
-            )
-            html += f'          <tr data-has-mismatch="{1 if has_mismatch else 0}">\n'
-            html += f'            <td class="sticky-col sticky-col-0"><strong>{_esc(str(row.get("SKU","")))}</strong></td>\n'
-            html += f'            <td class="sticky-col sticky-col-1">{_esc(str(row.get("Zoho Title","")))}</td>\n'
-            zoho_st = str(row.get("Zoho Status", ""))
-            st_color = "tag-no" if zoho_st.lower() == "inactive" else ""
-            html += f'            <td class="{st_color}">{_esc(zoho_st)}</td>\n'
-            html += f'            <td class="val-web">{_esc(str(row.get("Website Name","")))}</td>\n'
-            html += f'            <td class="val-google">{_esc(str(row.get("Google Name","")))}</td>\n'
-
-            in_web = str(row.get("In Website", ""))
-            in_google = str(row.get("In Google", ""))
-            html += f'            <td class="{"tag-yes" if in_web=="Yes" else "tag-no"}">{in_web}</td>\n'
-            html += f'            <td class="{"tag-yes" if in_google=="Yes" else "tag-no"}">{in_google}</td>\n'
-
-            for attr in attr_names:
-                name_v = str(row.get(f"{attr} [Name]", "") or "")
-                zoho_v = str(row.get(f"{attr} [Zoho]", "") or "")
-                web_v = str(row.get(f"{attr} [Web]", "") or "")
-                google_v = str(row.get(f"{attr} [Google]", "") or "")
-                status = str(row.get(f"{attr} [Status]", "") or "")
-
-                cell_cls = ""
-                if status == "MISMATCH":
-                    cell_cls = "cell-mismatch"
-                elif status == "PARTIAL":
-                    cell_cls = "cell-partial"
-                elif status == "OK":
-                    cell_cls = "cell-ok"
-
-                html += f'            <td class="{cell_cls} val-name">{_esc(name_v) or "&mdash;"}</td>\n'
-                html += f'            <td class="{cell_cls} val-zoho">{_esc(zoho_v) or "&mdash;"}</td>\n'
-                html += f'            <td class="{cell_cls} val-web">{_esc(web_v) or "&mdash;"}</td>\n'
-                html += f'            <td class="{cell_cls} val-google">{_esc(google_v) or "&mdash;"}</td>\n'
-
-                st_cls = {"OK": "tag-ok", "MISMATCH": "tag-mis", "PARTIAL": "tag-part"}.get(status, "cell-empty")
-                st_icon = {"OK": "&#10003;", "MISMATCH": "&#10007;", "PARTIAL": "~"}.get(status, "")
-                html += f'            <td class="{cell_cls} {st_cls}">{st_icon}</td>\n'
-
-            html += '          </tr>\n'
-
-        html += '          </tbody>\n'
-        html += '        </table>\n'
-        html += '      </div>\n'
-        html += '    </div>\n'
-        html += '    </div>\n'
-        html += '  </div>\n'
-
-    html += """
+        write('          <tbody>\n')
+        if len(df):
+            write(_grid_rows_html(df, attr_names))
+
+        write(
+            '          </tbody>\n'
+            '        </table>\n'
+            '      </div>\n'
+            '    </div>\n'
+            '    </div>\n'
+            '  </div>\n'
+        )
+
+    write("""
 </div>
 <script>
 function filterCat(input, catId) {
@@ -741,21 +805,63 @@ function toggleGlobalMismatch(btn) {
 }
 </script>
 </body>
-</html>"""
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
-
-    print(f"  Attribute grid: {output_path}")
-    return output_path
+</html>""")
 
 
 def _esc(text):
     """Escape HTML."""
     if not text:
         return ""
-    return (str(text)
-            .replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;"))
+    return _escape_str(str(text))
+
+
+def _escape_str(s):
+    # Four str.replace calls beat html.escape and str.translate on short cell text
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+def _grid_rows_html(df, attr_names):
+    """Render the <tbody> rows of one category grid, built column by column."""
+    status_cols = [f"{a} [Status]" for a in attr_names if f"{a} [Status]" in df.columns]
+    has_mismatch = (df[status_cols] == "MISMATCH").any(axis=1) if status_cols else pd.Series(False, index=df.index)
+    zoho_st = df["Zoho Status"].astype(str)
+    in_web = df["In Website"].astype(str)
+    in_google = df["In Google"].astype(str)
+
+    parts = [
+        has_mismatch.map({True: '          <tr data-has-mismatch="1">\n', False: '          <tr data-has-mismatch="0">\n'}),
+        '            <td class="sticky-col sticky-col-0"><strong>' + _esc_series(df["SKU"].astype(str)) + '</strong></td>\n',
+        '            <td class="sticky-col sticky-col-1">' + _esc_series(df["Zoho Title"].astype(str)) + '</td>\n',
+        '            <td class="' + zoho_st.str.lower().eq("inactive").map({True: "tag-no", False: ""}) + '">' + _esc_series(zoho_st) + '</td>\n',
+        '            <td class="val-web">' + _esc_series(df["Website Name"].astype(str)) + '</td>\n',
+        '            <td class="val-google">' + _esc_series(df["Google Name"].astype(str)) + '</td>\n',
+        '            <td class="' + in_web.eq("Yes").map({True: "tag-yes", False: "tag-no"}) + '">' + in_web + '</td>\n',
+        '            <td class="' + in_google.eq("Yes").map({True: "tag-yes", False: "tag-no"}) + '">' + in_google + '</td>\n',
+    ]
+
+    for attr in attr_names:
+        status = _cell_text(df, f"{attr} [Status]")
+        cell_cls = status.map({"MISMATCH": "cell-mismatch", "PARTIAL": "cell-partial", "OK": "cell-ok"}).fillna("")
+        for suffix, val_cls in (("[Name]", "val-name"), ("[Zoho]", "val-zoho"),
+                                ("[Web]", "val-web"), ("[Google]", "val-google")):
+            value = _esc_series(_cell_text(df, f"{attr} {suffix}")).replace("", "&mdash;")
+            parts.append('            <td class="' + cell_cls + f' {val_cls}">' + value + '</td>\n')
+        st_cls = status.map({"OK": "tag-ok", "MISMATCH": "tag-mis", "PARTIAL": "tag-part"}).fillna("cell-empty")
+        st_icon = status.map({"OK": "&#10003;", "MISMATCH": "&#10007;", "PARTIAL": "~"}).fillna("")
+        parts.append('            <td class="' + cell_cls + ' ' + st_cls + '">' + st_icon + '</td>\n')
+
+    parts.append(pd.Series('          </tr>\n', index=df.index))
+    return "".join(parts[0].str.cat(parts[1:]))
+
+
+def _cell_text(df, col):
+    """Column as display strings — missing or falsy values become "" (str(x or ""))."""
+    if col not in df.columns:
+        return pd.Series("", index=df.index)
+    s = df[col]
+    return s.where(s.astype(bool), "").astype(str)
+
+
+def _esc_series(s):
+    """Escape HTML for a whole Series of strings (same rules as _esc), in one pass."""
+    return s.map(_escape_str)
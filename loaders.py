@@ -5,29 +5,26 @@ Unified format: product_name, sku, price, sale_price, category, source
 
 import os
 import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-import re
 import requests
 import config
 
 
-def _clean_price(value):
-    """Clean price: remove currency symbols, spaces, commas."""
-    if pd.isna(value):
-        return None
-    s = str(value).strip()
-    s = re.sub(r"[^\d.]", "", s)
-    try:
-        return round(float(s), 2)
-    except ValueError:
-        return None
+def _clean_price(values):
+    """Clean a price column: remove currency symbols, spaces, commas. Unparseable -> NaN."""
+    digits = values.astype(str).str.replace(r"[^\d.]", "", regex=True)
+    prices = pd.to_numeric(digits, errors="coerce").round(2)
+    return prices.where(values.notna())
 
 
-def _clean_text(value):
-    """Clean text: remove extra spaces."""
-    if pd.isna(value):
-        return ""
-    return str(value).strip()
+def _clean_text(values):
+    """Clean a text column: remove extra spaces, missing -> ""."""
+    return values.fillna("").astype(str).str.strip()
+
+
+STRING_COLUMNS = ["product_name", "sku", "category", "status", "source"]
 
 
 def _normalize(df, column_map, source_name):
@@ -40,23 +37,30 @@ def _normalize(df, column_map, source_name):
             f"Found: {list(df.columns)}"
         )
 
-    df = df.rename(columns=available)
-
-    for col in config.UNIFIED_COLUMNS:
-        if col not in df.columns and col != "source":
-            df[col] = ""
-
+    # Keep only the mapped columns; any unified column the source lacks becomes ""
+    df = df[list(available)].rename(columns=available)
+    df = df.reindex(columns=config.UNIFIED_COLUMNS, fill_value="")
     df["source"] = source_name
-    df["product_name"] = df["product_name"].apply(_clean_text)
-    df["sku"] = df["sku"].apply(lambda x: _clean_text(x).upper() if pd.notna(x) else "")
-    df["price"] = df["price"].apply(_clean_price)
-    df["sale_price"] = df["sale_price"].apply(_clean_price)
-    df["category"] = df["category"].apply(_clean_text)
-    if "status" in df.columns:
-        df["status"] = df["status"].apply(_clean_text)
+    df["product_name"] = _clean_text(df["product_name"])
+    df["sku"] = _clean_text(df["sku"]).str.upper()
+    df["price"] = _clean_price(df["price"])
+    df["sale_price"] = _clean_price(df["sale_price"])
+    df["category"] = _clean_text(df["category"])
+    df["status"] = _clean_text(df["status"])
 
     df = df[df["product_name"].str.len() > 0]
-    return df[config.UNIFIED_COLUMNS].reset_index(drop=True)
+    # Text columns as pandas' string dtype; prices stay float64
+    df = df.astype({col: "string" for col in STRING_COLUMNS})
+    return df.reset_index(drop=True)
+
+
+CSV_CHUNK_ROWS = 50_000
+
+
+def _read_csv_filtered(path, row_filter):
+    """Read a CSV export in chunks, keeping only the rows row_filter lets through."""
+    parts = [row_filter(chunk) for chunk in pd.read_csv(path, dtype=str, chunksize=CSV_CHUNK_ROWS)]
+    return pd.concat(parts, ignore_index=True)
 
 
 # ============================================================
@@ -91,6 +95,27 @@ def _zoho_get_access_token():
     return _zoho_refresh_token()
 
 
+ZOHO_PER_PAGE = 200
+ZOHO_PAGE_WINDOW = 8  # pages requested concurrently
+ZOHO_ROW_FIELDS = ("name", "sku", "rate", "category_name")
+
+
+def _zoho_fetch_page(session, page):
+    """Fetch one page of items from the Zoho Inventory API."""
+    url = (
+        f"{config.ZOHO_API_BASE}/items"
+        f"?organization_id={config.ZOHO_ORGANIZATION_ID}"
+        f"&page={page}&per_page={ZOHO_PER_PAGE}"
+    )
+    resp = session.get(url)
+    resp.raise_for_status()
+    data = resp.json()
+
+    if data.get("code") != 0:
+        raise ValueError(f"Zoho API error: {data.get('message', data)}")
+    return data
+
+
 def load_zoho():
     """Load all products from Zoho Inventory API (with pagination)."""
     token = _zoho_get_access_token()
@@ -102,49 +127,50 @@ def load_zoho():
 
     headers = {"Authorization": f"Zoho-oauthtoken {token}"}
     all_items = []
-    page = 1
-    per_page = 200
-
-    while True:
-        url = (
-            f"{config.ZOHO_API_BASE}/items"
-            f"?organization_id={config.ZOHO_ORGANIZATION_ID}"
-            f"&page={page}&per_page={per_page}"
-        )
-        resp = requests.get(url, headers=headers)
-        resp.raise_for_status()
-        data = resp.json()
-
-        if data.get("code") != 0:
-            raise ValueError(f"Zoho API error: {data.get('message', data)}")
+    rows = []
 
+    def take(page, data):
+        """Collect one page of items; returns whether more pages follow."""
         items = data.get("items", [])
         if not items:
-            break
+            return False
 
+        # The debug cache keeps every item (the attribute checks read it);
+        # only active items become DataFrame rows
         all_items.extend(items)
+        rows.extend(
+            {field: item.get(field, "") for field in ZOHO_ROW_FIELDS}
+            for item in items
+            if str(item.get("status", "")).lower() != "inactive"
+        )
         print(f"    Zoho API: page {page}, fetched {len(items)} products")
-
-        if not data.get("page_context", {}).get("has_more_page", False):
-            break
-        page += 1
-
-    # Cache JSON for debugging
+        return data.get("page_context", {}).get("has_more_page", False)
+
+    with requests.Session() as session, ThreadPoolExecutor(ZOHO_PAGE_WINDOW) as pool:
+        session.headers.update(headers)
+        # Page 1 alone first — it says whether there is anything beyond it
+        has_more = take(1, _zoho_fetch_page(session, 1))
+        page = 2
+        # Later pages are independent requests — fetch a window of them at a time
+        while has_more:
+            futures = [pool.submit(_zoho_fetch_page, session, p)
+                       for p in range(page, page + ZOHO_PAGE_WINDOW)]
+            for offset, future in enumerate(futures):
+                has_more = take(page + offset, future.result())
+                if not has_more:
+                    break
+            # Past the last page — drop requests that have not started yet
+            for future in futures:
+                future.cancel()
+            page += ZOHO_PAGE_WINDOW
+
+    # Cache JSON for debugging — compact, it is re-read by the attribute checks
     cache_path = os.path.join(config.DATA_DIR, "zoho_api_cache.json")
     with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(all_items, f, ensure_ascii=False, indent=2)
-
-    # Convert to DataFrame — skip inactive items
-    rows = []
-    for item in all_items:
-        if str(item.get("status", "")).lower() == "inactive":
-            continue
-        rows.append({
-            "name": item.get("name", ""),
-            "sku": item.get("sku", ""),
-            "rate": item.get("rate", ""),
-            "category_name": item.get("category_name", ""),
-        })
+        json.dump(all_items, f, ensure_ascii=False, separators=(",", ":"))
+    # Binary mirror of the same items — name_parser reads it instead while it is up to date
+    with open(os.path.join(config.DATA_DIR, "zoho_api_cache.pkl"), "wb") as f:
+        pickle.dump(all_items, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     df = pd.DataFrame(rows)
     return _normalize(df, config.ZOHO_API_FIELDS, "zoho")
@@ -153,10 +179,14 @@ def load_zoho():
 def load_zoho_csv(path=None):
     """Load data from Zoho CSV export (fallback when API is unavailable)."""
     path = path or config.ZOHO_CSV
-    df = pd.read_csv(path, dtype=str, low_memory=False)
-    # Filter inactive items
-    if "Status" in df.columns:
-        df = df[df["Status"].str.lower() != "inactive"]
+
+    def active(df):
+        # Filter inactive items
+        if "Status" in df.columns:
+            df = df[df["Status"].str.lower() != "inactive"]
+        return df
+
+    df = _read_csv_filtered(path, active)
     return _normalize(df, config.ZOHO_CSV_COLUMNS, "zoho")
 
 
@@ -167,14 +197,16 @@ def load_zoho_csv(path=None):
 def load_website(path=None):
     """Load data from WooCommerce CSV export."""
     path = path or config.WEBSITE_CSV
-    df = pd.read_csv(path, dtype=str, low_memory=False)
 
-    if config.WEBSITE_FILTER_PUBLISHED and "Published" in df.columns:
-        df = df[df["Published"].astype(str) == "1"]
+    def listed(df):
+        if config.WEBSITE_FILTER_PUBLISHED and "Published" in df.columns:
+            df = df[df["Published"].astype(str) == "1"]
 
-    if config.WEBSITE_FILTER_TYPES and "Type" in df.columns:
-        df = df[df["Type"].isin(config.WEBSITE_FILTER_TYPES)]
+        if config.WEBSITE_FILTER_TYPES and "Type" in df.columns:
+            df = df[df["Type"].isin(config.WEBSITE_FILTER_TYPES)]
+        return df
 
+    df = _read_csv_filtered(path, listed)
     return _normalize(df, config.WEBSITE_COLUMNS, "website")
 
 
@@ -187,10 +219,10 @@ def load_google(path=None):
     path = path or config.GOOGLE_XLSX
 
     if path.endswith(".xlsx") or path.endswith(".xls"):
-        xls = pd.ExcelFile(path)
+        # All sheets in one read_excel call
+        sheets = pd.read_excel(path, sheet_name=None, dtype=str)
         all_dfs = []
-        for sheet in xls.sheet_names:
-            df = pd.read_excel(xls, sheet_name=sheet, dtype=str)
+        for df in sheets.values():
             # Normalize column names: remove extra spaces
             df.columns = [c.strip() for c in df.columns]
             # Some sheets have the SKU column with or without spaces
@@ -209,7 +241,7 @@ def load_google(path=None):
         if not all_dfs:
             raise ValueError("No sheets with SKU column found")
         # Merge — use common columns for normalization, others for attributes
-        # Normalize each sheet separately and combine
+        # Normalize each sheet separately and combine, keeping the first row per SKU
         normalized = []
         for df in all_dfs:
             try:
@@ -218,10 +250,8 @@ def load_google(path=None):
                 continue  # Sheet missing required columns
         if not normalized:
             raise ValueError("Failed to normalize any sheet")
-        result = pd.concat(normalized, ignore_index=True)
-        # Remove duplicates by SKU
-        result = result.drop_duplicates(subset="sku", keep="first")
-        return result.reset_index(drop=True)
+        df = pd.concat(normalized, ignore_index=True)
+        return df[~df["sku"].duplicated()].reset_index(drop=True)
     else:
         df = pd.read_csv(path, dtype=str)
         return _normalize(df, config.GOOGLE_COLUMNS, "google")
@@ -231,43 +261,58 @@ def load_google(path=None):
 # LOAD ALL SOURCES
 # ============================================================
 
-def load_all():
-    """Load all available sources."""
-    sources = {}
+def _load_zoho_source(log):
+    """Zoho — via API, fallback to CSV."""
+    try:
+        df = load_zoho()
+        log.append(f"  [OK] zoho: loaded {len(df)} products (API)")
+        return df
+    except Exception as e:
+        log.append(f"  [WARN] zoho API: {e}")
+    if not os.path.exists(config.ZOHO_CSV):
+        log.append(f"  [SKIP] zoho: no CSV fallback ({config.ZOHO_CSV})")
+        return None
+    try:
+        df = load_zoho_csv()
+        log.append(f"  [OK] zoho: loaded {len(df)} products (CSV)")
+        return df
+    except Exception as e2:
+        log.append(f"  [ERROR] zoho CSV: {e2}")
+        return None
+
 
-    # Zoho — via API, fallback to CSV
+def _load_file_source(name, path, loader, log):
+    """Website / Google Sheets — load from a local export file if present."""
+    if not os.path.exists(path):
+        log.append(f"  [SKIP] {name}: file not found ({path})")
+        return None
     try:
-        sources["zoho"] = load_zoho()
-        print(f"  [OK] zoho: loaded {len(sources['zoho'])} products (API)")
+        df = loader()
+        log.append(f"  [OK] {name}: loaded {len(df)} products")
+        return df
     except Exception as e:
-        print(f"  [WARN] zoho API: {e}")
-        if os.path.exists(config.ZOHO_CSV):
-            try:
-                sources["zoho"] = load_zoho_csv()
-                print(f"  [OK] zoho: loaded {len(sources['zoho'])} products (CSV)")
-            except Exception as e2:
-                print(f"  [ERROR] zoho CSV: {e2}")
-        else:
-            print(f"  [SKIP] zoho: no CSV fallback ({config.ZOHO_CSV})")
-
-    # Website — CSV file
-    if os.path.exists(config.WEBSITE_CSV):
-        try:
-            sources["website"] = load_website()
-            print(f"  [OK] website: loaded {len(sources['website'])} products")
-        except Exception as e:
-            print(f"  [ERROR] website: {e}")
-    else:
-        print(f"  [SKIP] website: file not found ({config.WEBSITE_CSV})")
-
-    # Google Sheets — Excel/CSV file
-    if os.path.exists(config.GOOGLE_XLSX):
-        try:
-            sources["google"] = load_google()
-            print(f"  [OK] google: loaded {len(sources['google'])} products")
-        except Exception as e:
-            print(f"  [ERROR] google: {e}")
-    else:
-        print(f"  [SKIP] google: file not found ({config.GOOGLE_XLSX})")
+        log.append(f"  [ERROR] {name}: {e}")
+        return None
+
 
+def load_all():
+    """Load all available sources (concurrently — they are independent and I/O-bound)."""
+    logs = {"zoho": [], "website": [], "google": []}
+    with ThreadPoolExecutor(len(logs)) as pool:
+        futures = {
+            "zoho": pool.submit(_load_zoho_source, logs["zoho"]),
+            "website": pool.submit(_load_file_source, "website", config.WEBSITE_CSV,
+                                   load_website, logs["website"]),
+            "google": pool.submit(_load_file_source, "google", config.GOOGLE_XLSX,
+                                  load_google, logs["google"]),
+        }
+
+    # Report in the usual source order once everything has finished
+    sources = {}
+    for name, future in futures.items():
+        for line in logs[name]:
+            print(line)
+        df = future.result()
+        if df is not None:
+            sources[name] = df
     return sources
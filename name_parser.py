@@ -7,14 +7,157 @@ Then compare extracted attributes with actual attributes from Website/Google She
 import re
 import json
 import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+import numpy as np
 import pandas as pd
 import config
 
+# orjson parses the Zoho cache several times faster; it is optional
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Arrow-backed strings hash, join and compare in C; used for the key columns of
+# the name-vs-attribute comparison when pyarrow is installed
+KEY_DTYPE = "string[pyarrow]" if find_spec("pyarrow") else object
+
 
 # ============================================================
 # ATTRIBUTE EXTRACTION FROM PRODUCT NAMES
 # ============================================================
 
+def _fuse(patterns):
+    """Join (pattern, name) pairs into one alternation, one capturing group per pattern."""
+    return re.compile("|".join(f"({p.pattern})" for p, _ in patterns), re.I)
+
+
+def _first_match(patterns, fused, title):
+    """
+    Name of the first pattern in list order that matches title, or None.
+    One fused scan finds the leftmost hit; only patterns ranked above it are re-checked.
+    """
+    m = fused.search(title)
+    if not m:
+        return None
+    hit = m.lastindex - 1
+    for pattern, name in patterns[:hit]:
+        if pattern.search(title):
+            return name
+    return patterns[hit][1]
+
+
+# Every attribute parse_name extracts needs a digit or one of these words in
+# the title (each pattern below contains one of them); titles with neither are skipped
+_PREFILTER_RE = re.compile(r'\d|' + '|'.join([
+    "bucket", "tooth", "hammer", "bolt", "thumb", "grapple", "coupler", "rake",
+    "pulverizer", "shear", "wheel", "compact", "roller", "fork", "broom", "cutter",
+    "auger", "piping", "pin", "shim", "retainer", "adapter", "trencher",
+    "excavator", "backhoe", "skid", "john", "kubota", "bobcat",
+]), re.I)
+
+_SIZE_RE = re.compile(r'^(\d+(?:\.\d+)?)["\u201c\u201d\u2033]\s')
+_DIAM_RE = re.compile(r'^(\d+)\s*mm\s+Diameter')
+_BIT_DIAM_RE = re.compile(r'^(\d+)\s*mm\s+(?:Hammer\s+)?(?:Moil|Wedge|Flat|Round|Blunt|Taper)\s')
+_DUAL_PIN_RE = re.compile(r'(\d+)\s*mm\s*[|/]\s*(\d+)\s*mm\s*[Pp]ins?')
+_PIN_RE = re.compile(r'(\d+)\s*mm\s*[Pp]ins?')
+_WEIGHT_RE = re.compile(
+    r'for\s+([\d.]+ ?[-\u2013\u2014] ?[\d.]+)\s*[Tt]ons?\s+'
+    r'(Mini\s+Excavators?|Backhoe(?:\s+Loaders?)?|Wheel\s+Loaders?|Skid\s+Steers?|Excavators?)'
+)
+
+_MACHINE_PATTERNS = [(re.compile(p, re.I), n) for p, n in [
+    (r'for\s+Mini\s+Excavators?', "Mini Excavators"),
+    (r'for\s+Backhoe\s+Loaders?', "Backhoe Loader"),
+    (r'for\s+Wheel\s+Loaders?', "Wheel Loader"),
+    (r'for\s+Skid\s+Steers?', "Skid Steer"),
+    (r'for\s+Excavators?', "Excavators"),
+]]
+
+_HEAD_STYLE_PATTERNS = [(re.compile(p, re.I), n) for p, n in [
+    (r'John\s+Deere\s+Wedge\s+Lock', "John Deere Wedge Lock"),
+    (r'Kubota\s+Wedge\s+(?:Lock\s+)?(?:Coupler\s+)?Style', "Kubota Wedge Lock"),
+    (r'Kubota\s+Wedge\s+Lock', "Kubota Wedge Lock"),
+    (r'Bobcat\s+X-?Change', "Bobcat X-Change"),
+    (r'Cat(?:erpillar)?\s+Pin\s+Grabber', "Cat Pin Grabber"),
+    (r'No\s+Quick\s+Coupler', "Pin On"),
+    (r'Pin\s+On', "Pin On"),
+]]
+
+_MACHINE_RE = _fuse(_MACHINE_PATTERNS)
+_HEAD_STYLE_RE = _fuse(_HEAD_STYLE_PATTERNS)
+
+_QUICK_COUPLER_RE = re.compile(r'(hydraulic|manual|spring)\s+quick\s+coupler|dual\s+lock.*coupler', re.I)
+_HAMMER_RE = re.compile(r'hydraulic\s+hammer|post\s+driver\s+hammer', re.I)
+_BOLT_ON_RE = re.compile(r'bolt-?on', re.I)
+
+_TYPE_PATTERNS = [(re.compile(p, re.I), n) for p, n in [
+    (r'V-?Bottom.*Bucket', "V-Bottom Bucket"),
+    (r'Ditching Bucket', "Ditching Bucket"),
+    (r'Severe Duty (?:Skeleton |Digging )?Bucket', "Severe Duty Bucket"),
+    (r'Heavy Duty (?:Digging |General Purpose )?Bucket', "Heavy Duty Bucket"),
+    (r'Digging Bucket', "Digging Bucket"),
+    (r'Trenching Bucket', "Trenching Bucket"),
+    (r'Banana Bucket', "Banana Bucket"),
+    (r'Claw Bucket', "Claw Bucket"),
+    (r'Tilt Bucket', "Tilt Bucket"),
+    (r'Skeleton Bucket', "Skeleton Bucket"),
+    (r'4 in 1 Bucket', "4 in 1 Bucket"),
+    (r'Grapple Bucket', "Grapple Bucket"),
+    (r'Ripper Tooth', "Ripper Tooth"),
+    (r'Hammer Plate Head', "Hammer Plate Head"),
+    (r'Bolt-?On Mount', "Bolt-On Mount"),
+    (r'Hydraulic Hammer', "Hydraulic Hammer"),
+    (r'Post Driver Hammer', "Post Driver Hammer"),
+    (r'Mechanical Thumb', "Mechanical Thumb"),
+    (r'(?:QC )?Main Pin Hydraulic (?:Progressive )?Thumb', "Hydraulic Thumb"),
+    (r'Mechanical Grapple', "Mechanical Grapple"),
+    (r'Rotating Hydraulic Grapple', "Rotating Grapple"),
+    (r'Hydraulic Quick Coupler', "Hydraulic Quick Coupler"),
+    (r'Manual Quick Coupler', "Manual Quick Coupler"),
+    (r'Brush Rake', "Brush Rake"),
+    (r'Root Rake', "Root Rake"),
+    (r'Bucket Rake', "Bucket Rake"),
+    (r'Concrete Pulverizer', "Concrete Pulverizer"),
+    (r'Hydraulic Shear', "Hydraulic Shear"),
+    (r'Compaction Wheel', "Compaction Wheel"),
+    (r'Plate Compactor', "Plate Compactor"),
+    (r'Vibratory Roller', "Vibratory Roller"),
+    (r'Pallet Fork', "Pallet Fork"),
+    (r'Angle Broom', "Angle Broom"),
+    (r'Sweeper Broom', "Sweeper Broom"),
+    (r'Brush Cutter', "Brush Cutter"),
+    (r'Auger (?:Drive )?Bit', "Auger Bit"),
+    (r'Rock Auger Bit', "Rock Auger Bit"),
+    (r'Aux Hydraulic Piping', "Aux Hydraulic Piping Kit"),
+    (r'Bucket Pin', "Bucket Pin"),
+    (r'Bucket Shim', "Bucket Shim"),
+    (r'Bucket Tooth', "Bucket Tooth"),
+    (r'Side Cutter', "Side Cutter"),
+    (r'Tooth Retainer', "Tooth Retainer"),
+    (r'Tooth Adapter', "Tooth Adapter"),
+    (r'Tooth Pin', "Tooth Pin"),
+    (r'Trencher', "Trencher"),
+]]
+_TYPE_RE = _fuse(_TYPE_PATTERNS)
+
+_HEX_RE = re.compile(r'(\d+)["\u201c\u201d\u2033]\s*Hex')
+_SHIM_RE = re.compile(r'^(\d+)\s*x\s*(\d+)\s*x\s*(\d+)\s*mm')
+_PIN_LEN_RE = re.compile(r'with\s+(\d+)\s*mm\s+[Ll]ength')
+_FITS_SKID_STEER_RE = re.compile(r'Skid Steer', re.I)
+
+_ATTACHMENT_PATTERNS = [(re.compile(p, re.I), n) for p, n in [
+    (r'Skid\s+Steer', "Skid Steer Attachment"),
+    (r'Mini\s+Excavator', "Mini Excavator Attachment"),
+    (r'Excavator', "Excavator Attachment"),
+    (r'Backhoe', "Backhoe Loader Attachment"),
+]]
+_ATTACHMENT_RE = _fuse(_ATTACHMENT_PATTERNS)
+
+
 def parse_name(title, category=""):
     """
     Extract structured attributes from a product website title.
@@ -22,45 +165,55 @@ def parse_name(title, category=""):
     """
     if not title or not isinstance(title, str):
         return {}
+    return dict(_parse_title(title.strip()))
+
+
+# Large enough to hold every title of a catalog, so the name-vs-attribute check and
+# the attribute grid (forked workers inherit the cache) parse each title only once
+PARSE_CACHE_SIZE = 200_000
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_title(title):
+    """parse_name body, memoized per stripped title — variants often share a title.
 
-    title = title.strip()
+    The returned dict is cached and must not be modified; parse_name hands out copies.
+    """
     attrs = {}
+    if not _PREFILTER_RE.search(title):
+        return attrs
 
     # --- Size (inches) ---
     # "42" Ditching Bucket", "75" 4 in 1 Bucket", "24" Digging Bucket"
     # Also handle smart quotes: " (\u201c), " (\u201d), ″ (\u2033)
     # Quote is REQUIRED to avoid matching "800 Joules..." as bucket size
-    m = re.match(r'^(\d+(?:\.\d+)?)["\u201c\u201d\u2033]\s', title)
+    m = _SIZE_RE.match(title)
     if m:
         attrs["Bucket Size"] = f'{m.group(1)}"'
 
     # --- Size for pins/bits (mm diameter) ---
     # "60 mm Diameter Bucket Pin"
     # "75mm Hammer Moil Chisel Bit", "65mm Wedge Chisel Bit", "50mm Flat Chisel Bit"
-    m_diam = re.match(r'^(\d+)\s*mm\s+Diameter', title)
+    m_diam = _DIAM_RE.match(title)
     if not m_diam:
-        m_diam = re.match(r'^(\d+)\s*mm\s+(?:Hammer\s+)?(?:Moil|Wedge|Flat|Round|Blunt|Taper)\s', title)
+        m_diam = _BIT_DIAM_RE.match(title)
     if m_diam:
         attrs["Diameter (mm)"] = f"{m_diam.group(1)} mm"
 
     # --- Pin Size ---
     # "45mm | 38mm Pins", "45mm / 38mm Pins", "45mm Pins"
-    m_dual_pin = re.search(r'(\d+)\s*mm\s*[|/]\s*(\d+)\s*mm\s*[Pp]ins?', title)
+    m_dual_pin = _DUAL_PIN_RE.search(title)
     if m_dual_pin:
         attrs["Pin Size"] = f"{m_dual_pin.group(1)}mm | {m_dual_pin.group(2)}mm"
     else:
-        m_pin = re.search(r'(\d+)\s*mm\s*[Pp]ins?', title)
+        m_pin = _PIN_RE.search(title)
         if m_pin:
             attrs["Pin Size"] = f"{m_pin.group(1)}mm"
 
     # --- Carrier Weight Class ---
     # "for 3 - 4.5 Tons Mini Excavators", "for 16 – 25 Tons Excavators"
     # Also handle en-dash (–), em-dash (—)
-    m_weight = re.search(
-        r'for\s+([\d.]+ ?[-\u2013\u2014] ?[\d.]+)\s*[Tt]ons?\s+'
-        r'(Mini\s+Excavators?|Backhoe(?:\s+Loaders?)?|Wheel\s+Loaders?|Skid\s+Steers?|Excavators?)',
-        title
-    )
+    m_weight = _WEIGHT_RE.search(title)
     if m_weight:
         tons = m_weight.group(1).replace(" ", "").replace("\u2013", "-").replace("\u2014", "-")
         attrs["Carrier Weight Class"] = f"{tons} tons"
@@ -79,135 +232,63 @@ def parse_name(title, category=""):
     # --- Machine Type (without weight range) ---
     # "for Backhoe Loaders", "for Wheel Loaders", "for Skid Steers", etc.
     if "Machine Type" not in attrs:
-        machine_patterns = [
-            (r'(?i)for\s+Mini\s+Excavators?', "Mini Excavators"),
-            (r'(?i)for\s+Backhoe\s+Loaders?', "Backhoe Loader"),
-            (r'(?i)for\s+Wheel\s+Loaders?', "Wheel Loader"),
-            (r'(?i)for\s+Skid\s+Steers?', "Skid Steer"),
-            (r'(?i)for\s+Excavators?', "Excavators"),
-        ]
-        for pattern, machine_name in machine_patterns:
-            if re.search(pattern, title):
-                attrs["Machine Type"] = machine_name
-                break
+        machine_name = _first_match(_MACHINE_PATTERNS, _MACHINE_RE, title)
+        if machine_name:
+            attrs["Machine Type"] = machine_name
 
     # --- Head Style ---
     # The 4 head styles: Pin On, John Deere Wedge Lock, Bobcat X-Change, Kubota Wedge Lock
     # "No Quick Coupler" = Pin On (used for brand compatibility)
     # Note: Quick Coupler product types (Dual Lock HQC, Spring Manual QC) are NOT head styles —
     # those are product categories captured by Product Type above.
-    head_style_patterns = [
-        (r'(?i)John\s+Deere\s+Wedge\s+Lock', "John Deere Wedge Lock"),
-        (r'(?i)Kubota\s+Wedge\s+(?:Lock\s+)?(?:Coupler\s+)?Style', "Kubota Wedge Lock"),
-        (r'(?i)Kubota\s+Wedge\s+Lock', "Kubota Wedge Lock"),
-        (r'(?i)Bobcat\s+X-?Change', "Bobcat X-Change"),
-        (r'(?i)Cat(?:erpillar)?\s+Pin\s+Grabber', "Cat Pin Grabber"),
-        (r'(?i)No\s+Quick\s+Coupler', "Pin On"),
-        (r'(?i)Pin\s+On', "Pin On"),
-    ]
-    for pattern, style_name in head_style_patterns:
-        if re.search(pattern, title):
-            attrs["Head Style"] = style_name
-            break
+    style_name = _first_match(_HEAD_STYLE_PATTERNS, _HEAD_STYLE_RE, title)
+    if style_name:
+        attrs["Head Style"] = style_name
 
     # If no head style detected and has explicit pin size → Pin On
     # But skip for quick coupler products and actual hammers (pins = mounting pins, not head style)
     # Note: "Bolt-On Mount for ... Hydraulic Hammers" is NOT a hammer — check for "Bolt-On" before excluding
     if "Head Style" not in attrs and "Pin Size" in attrs:
-        if not re.search(r'(?i)(hydraulic|manual|spring)\s+quick\s+coupler|dual\s+lock.*coupler', title):
-            is_hammer_product = (
-                re.search(r'(?i)hydraulic\s+hammer|post\s+driver\s+hammer', title)
-                and not re.search(r'(?i)bolt-?on', title)
-            )
+        if not _QUICK_COUPLER_RE.search(title):
+            is_hammer_product = _HAMMER_RE.search(title) and not _BOLT_ON_RE.search(title)
             if not is_hammer_product:
                 attrs["Head Style"] = "Pin On"
 
     # --- Product Type / Category (from name) ---
-    type_patterns = [
-        (r'(?i)V-?Bottom.*Bucket', "V-Bottom Bucket"),
-        (r'(?i)Ditching Bucket', "Ditching Bucket"),
-        (r'(?i)Severe Duty (?:Skeleton |Digging )?Bucket', "Severe Duty Bucket"),
-        (r'(?i)Heavy Duty (?:Digging |General Purpose )?Bucket', "Heavy Duty Bucket"),
-        (r'(?i)Digging Bucket', "Digging Bucket"),
-        (r'(?i)Trenching Bucket', "Trenching Bucket"),
-        (r'(?i)Banana Bucket', "Banana Bucket"),
-        (r'(?i)Claw Bucket', "Claw Bucket"),
-        (r'(?i)Tilt Bucket', "Tilt Bucket"),
-        (r'(?i)Skeleton Bucket', "Skeleton Bucket"),
-        (r'(?i)4 in 1 Bucket', "4 in 1 Bucket"),
-        (r'(?i)Grapple Bucket', "Grapple Bucket"),
-        (r'(?i)Ripper Tooth', "Ripper Tooth"),
-        (r'(?i)Hammer Plate Head', "Hammer Plate Head"),
-        (r'(?i)Bolt-?On Mount', "Bolt-On Mount"),
-        (r'(?i)Hydraulic Hammer', "Hydraulic Hammer"),
-        (r'(?i)Post Driver Hammer', "Post Driver Hammer"),
-        (r'(?i)Mechanical Thumb', "Mechanical Thumb"),
-        (r'(?i)(?:QC )?Main Pin Hydraulic (?:Progressive )?Thumb', "Hydraulic Thumb"),
-        (r'(?i)Mechanical Grapple', "Mechanical Grapple"),
-        (r'(?i)Rotating Hydraulic Grapple', "Rotating Grapple"),
-        (r'(?i)Hydraulic Quick Coupler', "Hydraulic Quick Coupler"),
-        (r'(?i)Manual Quick Coupler', "Manual Quick Coupler"),
-        (r'(?i)Brush Rake', "Brush Rake"),
-        (r'(?i)Root Rake', "Root Rake"),
-        (r'(?i)Bucket Rake', "Bucket Rake"),
-        (r'(?i)Concrete Pulverizer', "Concrete Pulverizer"),
-        (r'(?i)Hydraulic Shear', "Hydraulic Shear"),
-        (r'(?i)Compaction Wheel', "Compaction Wheel"),
-        (r'(?i)Plate Compactor', "Plate Compactor"),
-        (r'(?i)Vibratory Roller', "Vibratory Roller"),
-        (r'(?i)Pallet Fork', "Pallet Fork"),
-        (r'(?i)Angle Broom', "Angle Broom"),
-        (r'(?i)Sweeper Broom', "Sweeper Broom"),
-        (r'(?i)Brush Cutter', "Brush Cutter"),
-        (r'(?i)Auger (?:Drive )?Bit', "Auger Bit"),
-        (r'(?i)Rock Auger Bit', "Rock Auger Bit"),
-        (r'(?i)Aux Hydraulic Piping', "Aux Hydraulic Piping Kit"),
-        (r'(?i)Bucket Pin', "Bucket Pin"),
-        (r'(?i)Bucket Shim', "Bucket Shim"),
-        (r'(?i)Bucket Tooth', "Bucket Tooth"),
-        (r'(?i)Side Cutter', "Side Cutter"),
-        (r'(?i)Tooth Retainer', "Tooth Retainer"),
-        (r'(?i)Tooth Adapter', "Tooth Adapter"),
-        (r'(?i)Tooth Pin', "Tooth Pin"),
-        (r'(?i)Trencher', "Trencher"),
-    ]
-    for pattern, type_name in type_patterns:
-        if re.search(pattern, title):
-            attrs["Product Type"] = type_name
-            break
+    type_name = _first_match(_TYPE_PATTERNS, _TYPE_RE, title)
+    if type_name:
+        attrs["Product Type"] = type_name
 
     # --- Hex size for auger bits ---
-    m_hex = re.search(r'(\d+)["\u201c\u201d\u2033]\s*Hex', title)
+    m_hex = _HEX_RE.search(title)
     if m_hex:
         attrs["Hex Size"] = f'{m_hex.group(1)}"'
 
     # --- Shim dimensions ---
     # Title format: "90 x 160 x 5 mm ..." → first = Interior (pin hole), second = Outer, third = Thickness
     # Note: Zoho has these labels swapped; Google/Website have them correct.
-    m_shim = re.match(r'^(\d+)\s*x\s*(\d+)\s*x\s*(\d+)\s*mm', title)
+    m_shim = _SHIM_RE.match(title)
     if m_shim:
         attrs["Interior Diameter"] = f"{m_shim.group(1)} mm"
         attrs["Outer Diameter"] = f"{m_shim.group(2)} mm"
         attrs["Thickness"] = f"{m_shim.group(3)} mm"
 
     # --- Bucket Pin length ---
-    m_pin_len = re.search(r'with\s+(\d+)\s*mm\s+[Ll]ength', title)
+    m_pin_len = _PIN_LEN_RE.search(title)
     if m_pin_len:
         attrs["Length (mm)"] = f"{m_pin_len.group(1)} mm"
 
+    # --- Attachment Types (derived from title context) ---
+    # One fused scan; Skid Steer > Mini Excavator > Excavator > Backhoe
+    attachment = _first_match(_ATTACHMENT_PATTERNS, _ATTACHMENT_RE, title)
+
     # --- Fits To (Skid Steer) ---
-    if re.search(r'(?i)Skid Steer', title):
+    # Only possible when the title mentions a skid steer at all
+    if attachment == "Skid Steer Attachment" and _FITS_SKID_STEER_RE.search(title):
         attrs["Fits To"] = "Skid Steer"
 
-    # --- Attachment Types (derived from title context) ---
-    if re.search(r'(?i)Skid\s+Steer', title):
-        attrs["Attachment Types"] = "Skid Steer Attachment"
-    elif re.search(r'(?i)Mini\s+Excavator', title):
-        attrs["Attachment Types"] = "Mini Excavator Attachment"
-    elif re.search(r'(?i)Excavator', title):
-        attrs["Attachment Types"] = "Excavator Attachment"
-    elif re.search(r'(?i)Backhoe', title):
-        attrs["Attachment Types"] = "Backhoe Loader Attachment"
+    if attachment:
+        attrs["Attachment Types"] = attachment
 
     return attrs
 
@@ -216,37 +297,83 @@ def parse_name(title, category=""):
 # LOAD ACTUAL ATTRIBUTES FROM SOURCES
 # ============================================================
 
-def _load_zoho_website_titles():
-    """Load cf_website_title_only and category from Zoho cache."""
+# Zoho cf_ custom fields -> display attribute names
+_ZOHO_CF_MAP = {
+    "cf_front_pin_size": "Front Pin Diameter (mm)",
+    "cf_back_pin_size": "Rear Pin Diameter (mm)",
+    "cf_coupler_head_type": "Coupler Head Type",
+    "cf_product_weight": "Product Weight (kg)",
+    "cf_product_weight_lbs": "Product Weight (lbs)",
+    "cf_product_width_mm": "Product Width (mm)",
+    "cf_product_width_in": "Product Width (in)",
+    "cf_capacity_yds": "Product Capacity (yds)",
+    "cf_product_capacity_m3": "Capacity (m³)",
+    "cf_teeth_type": "Teeth Type",
+    "cf_center_to_center": "Center to Center",
+    "cf_front_ear_to_ear": "Front Ear to Ear",
+    "cf_back_ear_to_ear": "Rear Ear to Ear",
+    "cf_drain_holes": "Drain Holes",
+    "cf_add_ons": "Add-on included",
+    # cf_model_number intentionally omitted — not used
+}
+
+
+def _load_zoho_items():
+    """Parsed Zoho cache items; the JSON is only re-read when the file changes."""
     cache_path = os.path.join(config.DATA_DIR, "zoho_api_cache.json")
     if not os.path.exists(cache_path):
-        return {}
-    with open(cache_path, "r", encoding="utf-8") as f:
-        items = json.load(f)
-    result = {}
-    for item in items:
-        sku = str(item.get("sku", "")).strip().upper()
-        if not sku:
-            continue
-        result[sku] = {
-            "website_title": item.get("cf_website_title_only", "") or "",
-            "category": item.get("category_name", "") or "",
-        }
-    return result
+        return []
+    return _read_zoho_cache(cache_path, os.path.getmtime(cache_path))
+
+
+@lru_cache(maxsize=1)
+def _read_zoho_cache(cache_path, mtime):
+    # Prefer the pickle mirror written by load_zoho unless the JSON is newer
+    mirror = os.path.splitext(cache_path)[0] + ".pkl"
+    if os.path.exists(mirror) and os.path.getmtime(mirror) >= mtime:
+        try:
+            with open(mirror, "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+    with open(cache_path, "rb") as f:
+        return _json_loads(f.read())
+
+
+def _load_zoho_website_titles():
+    """Load cf_website_title_only and category from Zoho cache."""
+    return _zoho_indices()[0]
 
 
 def _load_zoho_attrs():
     """Load actual attributes from Zoho cache (attribute_name/option + cf_ fields)."""
+    return _zoho_indices()[1]
+
+
+def _zoho_indices():
     cache_path = os.path.join(config.DATA_DIR, "zoho_api_cache.json")
     if not os.path.exists(cache_path):
-        return {}
-    with open(cache_path, "r", encoding="utf-8") as f:
-        items = json.load(f)
+        return {}, {}
+    return _build_zoho_indices(cache_path, os.path.getmtime(cache_path))
+
+
+@lru_cache(maxsize=1)
+def _build_zoho_indices(cache_path, mtime):
+    """SKU -> title/category and SKU -> attrs maps, built in one pass over the items.
+
+    Both maps are cached until the file changes and must not be modified by callers.
+    """
+    items = _read_zoho_cache(cache_path, mtime)
+    titles = {}
     result = {}
     for item in items:
         sku = str(item.get("sku", "")).strip().upper()
         if not sku:
             continue
+        titles[sku] = {
+            "website_title": item.get("cf_website_title_only", "") or "",
+            "category": item.get("category_name", "") or "",
+        }
         attrs = {}
         # attribute_name1..3 / attribute_option_name1..3
         for i in range(1, 4):
@@ -255,48 +382,47 @@ def _load_zoho_attrs():
             if name and val:
                 attrs[name.strip()] = val.strip()
         # cf_ custom fields
-        cf_map = {
-            "cf_front_pin_size": "Front Pin Diameter (mm)",
-            "cf_back_pin_size": "Rear Pin Diameter (mm)",
-            "cf_coupler_head_type": "Coupler Head Type",
-            "cf_product_weight": "Product Weight (kg)",
-            "cf_product_weight_lbs": "Product Weight (lbs)",
-            "cf_product_width_mm": "Product Width (mm)",
-            "cf_product_width_in": "Product Width (in)",
-            "cf_capacity_yds": "Product Capacity (yds)",
-            "cf_product_capacity_m3": "Capacity (m³)",
-            "cf_teeth_type": "Teeth Type",
-            "cf_center_to_center": "Center to Center",
-            "cf_front_ear_to_ear": "Front Ear to Ear",
-            "cf_back_ear_to_ear": "Rear Ear to Ear",
-            "cf_drain_holes": "Drain Holes",
-            "cf_add_ons": "Add-on included",
-            # cf_model_number intentionally omitted — not used
-        }
-        for cf_key, display_name in cf_map.items():
+        for cf_key, display_name in _ZOHO_CF_MAP.items():
             val = item.get(cf_key, "")
             if val and str(val).strip() and str(val).lower() not in ("false", ""):
                 attrs[display_name] = str(val).strip()
         result[sku] = attrs
-    return result
+    return titles, result
+
+
+_WEBSITE_ATTR_SLOTS = [(f"Attribute {i} name", f"Attribute {i} value(s)") for i in range(1, 24)]
+_WEBSITE_ATTR_COLUMNS = {"SKU"} | {col for slot in _WEBSITE_ATTR_SLOTS for col in slot}
 
 
 def _load_website_attrs():
     """Load actual attributes from WooCommerce CSV."""
     if not os.path.exists(config.WEBSITE_CSV):
         return {}
-    df = pd.read_csv(config.WEBSITE_CSV, dtype=str, low_memory=False)
+    # Only SKU and the attribute name/value columns — the export is much wider
+    df = pd.read_csv(config.WEBSITE_CSV, dtype=str, usecols=lambda c: c in _WEBSITE_ATTR_COLUMNS)
+    if "SKU" not in df.columns:
+        return {}
+    skus = df["SKU"].astype(str).str.strip().str.upper().tolist()
+    # One (names, values) pair of plain lists per attribute slot; NaN names -> None
+    pairs = []
+    for name_col, val_col in _WEBSITE_ATTR_SLOTS:
+        if name_col not in df.columns:
+            continue
+        names = df[name_col]
+        names = names.str.strip().where(names.notna(), None).tolist()
+        if val_col in df.columns:
+            values = df[val_col].astype(str).str.strip().tolist()
+        else:
+            values = [""] * len(df)
+        pairs.append((names, values))
     result = {}
-    for _, row in df.iterrows():
-        sku = str(row.get("SKU", "")).strip().upper()
+    for i, sku in enumerate(skus):
         if not sku:
             continue
         attrs = {}
-        for i in range(1, 24):
-            name_col = f"Attribute {i} name"
-            val_col = f"Attribute {i} value(s)"
-            if name_col in df.columns and pd.notna(row.get(name_col)):
-                attrs[row[name_col].strip()] = str(row.get(val_col, "")).strip()
+        for names, values in pairs:
+            if names[i] is not None:
+                attrs[names[i]] = values[i]
         result[sku] = attrs
     return result
 
@@ -324,18 +450,25 @@ def _load_google_attrs():
             sku_col = df.columns[0]
         if sku_col is None:
             continue
-        for _, row in df.iterrows():
-            sku = str(row.get(sku_col, "")).strip().upper()
+        skus = df[sku_col].astype(str).str.strip().str.upper().tolist()
+        # Cleaned values per attribute column; None where the cell is empty
+        columns = []
+        for j, col in enumerate(df.columns):
+            if col == sku_col:
+                continue
+            raw = df.iloc[:, j]
+            text = raw.astype(str)
+            values = text.str.strip()
+            keep = raw.notna() & values.ne("") & text.str.lower().ne("nan")
+            clean = col.replace("/NA", "").replace("/Filter", "").strip()
+            columns.append((clean, values.where(keep, None).tolist()))
+        for i, sku in enumerate(skus):
             if not sku or sku == "NAN":
                 continue
             attrs = {}
-            for col in df.columns:
-                if col == sku_col:
-                    continue
-                val = row.get(col, "")
-                if pd.notna(val) and str(val).strip() and str(val).lower() != "nan":
-                    clean = col.replace("/NA", "").replace("/Filter", "").strip()
-                    attrs[clean] = str(val).strip()
+            for clean, values in columns:
+                if values[i] is not None:
+                    attrs[clean] = values[i]
             result[sku] = attrs
     return result
 
@@ -344,24 +477,30 @@ def _load_google_attrs():
 # NORMALIZE ATTRIBUTE VALUES FOR COMPARISON
 # ============================================================
 
+# Smart quotes and primes -> standard, en/em dashes -> hyphen
+_QUOTES_DASHES = str.maketrans({
+    '\u201c': '"', '\u201d': '"', '\u2033': '"',
+    '\u2018': "'", '\u2019': "'", '\u2032': "'",
+    '\u2013': '-', '\u2014': '-',
+})
+_DROP_PUNCT = str.maketrans("", "", ",\"'")
+_UNIT_SUFFIX_RE = re.compile(r'\s*(mm|tons?|lbs?|in|inches|")\s*$')
+_MM_RE = re.compile(r'(\d)\s*mm')
+_SPACES_RE = re.compile(r'\s+')
+
+
 def _normalize_value(val):
     """Normalize attribute value for comparison."""
     if not val:
         return ""
-    s = str(val).strip().lower()
-    # Normalize smart quotes and primes to standard
-    s = s.replace('\u201c', '"').replace('\u201d', '"').replace('\u2033', '"')
-    s = s.replace('\u2018', "'").replace('\u2019', "'").replace('\u2032', "'")
-    # Normalize dashes
-    s = s.replace('\u2013', '-').replace('\u2014', '-')
+    s = str(val).strip().lower().translate(_QUOTES_DASHES)
     # Remove trailing units for comparison
-    s = re.sub(r'\s*(mm|tons?|lbs?|in|inches|")\s*$', '', s)
+    s = _UNIT_SUFFIX_RE.sub('', s)
     # Collapse spaces around mm (40mm == 40 mm)
-    s = re.sub(r'(\d)\s*mm', r'\1mm', s)
-    s = re.sub(r'\s+', ' ', s)
-    # Fix escaped commas from WooCommerce CSV (\, -> ,)
-    s = s.replace('\\,', ',')
-    s = s.replace(',', '').replace('"', '').replace("'", '')
+    s = _MM_RE.sub(r'\1mm', s)
+    s = _SPACES_RE.sub(' ', s)
+    # Fix escaped commas from WooCommerce CSV (\, -> ,), then drop commas and quotes
+    s = s.replace('\\,', ',').translate(_DROP_PUNCT)
     s = s.rstrip('/')
     return s
 
@@ -393,6 +532,63 @@ ATTR_MAP = {
 }
 
 
+def _invert_attr_map():
+    """Actual attribute name -> [(parsed attribute, rank in its ATTR_MAP list), ...].
+
+    Some names (e.g. "Pin Diameter (mm)") serve more than one parsed attribute.
+    """
+    targets = {}
+    for attr, names in ATTR_MAP.items():
+        for rank, name in enumerate(names):
+            targets.setdefault(name, []).append((attr, rank))
+    return targets
+
+
+_ALIAS_TARGETS = _invert_attr_map()
+
+
+# Synonyms / equivalent terms (normalized values)
+_SYNONYM_SETS = [
+    {"excavators", "excavator", "excavator attachment"},
+    {"mini excavators", "mini excavator", "mini excavator attachment"},
+    {"skid steer", "skid steer attachment", "skid steer loader"},
+    {"pin on", "pin on style", "pin on coupler", "pin on style coupler",
+     "no quick coupler pin on coupler", "backhoe pin on style",
+     "backhoe pin on coupler", "bolt-on adapter",
+     "no quick coupler", "no coupler"},
+    {"bobcat x-change coupler", "bobcat x-change", "bobcat style",
+     "bobcat x-change style", "bobcat x change"},
+    {"john deere wedge lock coupler", "john deere wedge lock", "john deere style",
+     "jd wedge lock", "deere wedge lock coupler", "deere style",
+     "john deere wedge lock style"},
+    {"kubota wedge lock coupler", "kubota wedge lock", "kubota style",
+     "kubota wedge style", "kubota wedge lock style"},
+    {"cat pin grabber coupler", "cat pin grabber", "cat pin grabber style"},
+    {"dual lock hydraulic quick coupler", "dual lock hqc", "dual lock coupler"},
+    {"heavy duty bucket", "heavy duty digging bucket", "heavy duty general purpose bucket"},
+    {"rotating grapple", "rotating hydraulic grapple"},
+    {"severe duty bucket", "severe duty skeleton bucket with teeth",
+     "severe duty skeleton bucket"},
+    {"backhoe", "backhoe loader", "backhoe loaders",
+     "backhoe loader attachment", "backhoe attachment"},
+    {"wheel loader", "wheel loaders"},
+    {"excavators", "excavator"},
+    {"v-bottom bucket", "v-bottom buckets"},
+    {"hammer plate head", "hammer plate heads"},
+]
+# value -> ids of the synonym sets it belongs to (some values are in several)
+_SYNONYM_GROUPS = {
+    value: {i for i, group in enumerate(_SYNONYM_SETS) if value in group}
+    for syn_set in _SYNONYM_SETS for value in syn_set
+}
+
+
+def _synonyms(p, a):
+    """True if both normalized values appear in the same synonym set."""
+    groups = _SYNONYM_GROUPS.get(p)
+    return groups is not None and not groups.isdisjoint(_SYNONYM_GROUPS.get(a, ()))
+
+
 def _match_value(parsed_val, actual_val):
     """Check if parsed value matches actual value (fuzzy)."""
     p = _normalize_value(parsed_val)
@@ -414,38 +610,8 @@ def _match_value(parsed_val, actual_val):
             if p_nums and a_nums and p_nums == a_nums:
                 return True
         return False
-    # Synonyms / equivalent terms
-    synonyms = [
-        ({"excavators", "excavator", "excavator attachment"}, True),
-        ({"mini excavators", "mini excavator", "mini excavator attachment"}, True),
-        ({"skid steer", "skid steer attachment", "skid steer loader"}, True),
-        ({"pin on", "pin on style", "pin on coupler", "pin on style coupler",
-          "no quick coupler pin on coupler", "backhoe pin on style",
-          "backhoe pin on coupler", "bolt-on adapter",
-          "no quick coupler", "no coupler"}, True),
-        ({"bobcat x-change coupler", "bobcat x-change", "bobcat style",
-          "bobcat x-change style", "bobcat x change"}, True),
-        ({"john deere wedge lock coupler", "john deere wedge lock", "john deere style",
-          "jd wedge lock", "deere wedge lock coupler", "deere style",
-          "john deere wedge lock style"}, True),
-        ({"kubota wedge lock coupler", "kubota wedge lock", "kubota style",
-          "kubota wedge style", "kubota wedge lock style"}, True),
-        ({"cat pin grabber coupler", "cat pin grabber", "cat pin grabber style"}, True),
-        ({"dual lock hydraulic quick coupler", "dual lock hqc", "dual lock coupler"}, True),
-        ({"heavy duty bucket", "heavy duty digging bucket", "heavy duty general purpose bucket"}, True),
-        ({"rotating grapple", "rotating hydraulic grapple"}, True),
-        ({"severe duty bucket", "severe duty skeleton bucket with teeth",
-          "severe duty skeleton bucket"}, True),
-        ({"backhoe", "backhoe loader", "backhoe loaders",
-          "backhoe loader attachment", "backhoe attachment"}, True),
-        ({"wheel loader", "wheel loaders"}, True),
-        ({"excavators", "excavator"}, True),
-        ({"v-bottom bucket", "v-bottom buckets"}, True),
-        ({"hammer plate head", "hammer plate heads"}, True),
-    ]
-    for syn_set, result in synonyms:
-        if p in syn_set and a in syn_set:
-            return result
+    if _synonyms(p, a):
+        return True
     # If actual contains multiple values (comma-separated in raw value), check each
     if "," in str(actual_val):
         raw_parts = re.split(r'(?<!\\),', str(actual_val))
@@ -455,9 +621,8 @@ def _match_value(parsed_val, actual_val):
                 continue
             if part == p:
                 return True
-            for syn_set, result in synonyms:
-                if p in syn_set and part in syn_set:
-                    return result
+            if _synonyms(p, part):
+                return True
     # Number extraction and compare
     p_nums = re.findall(r'[\d.]+', p)
     a_nums = re.findall(r'[\d.]+', a)
@@ -491,6 +656,9 @@ def _match_value(parsed_val, actual_val):
 # MAIN: COMPARE PARSED NAME ATTRIBUTES VS ACTUAL
 # ============================================================
 
+PARALLEL_MIN_ROWS = 20_000  # distinct value pairs; below this a process pool costs more than it saves
+
+
 def compare_name_vs_attributes():
     """
     For each product:
@@ -503,67 +671,144 @@ def compare_name_vs_attributes():
     web_attrs = _load_website_attrs()
     google_attrs = _load_google_attrs()
 
-    rows = []
-    for sku, zoho_data in zoho_titles.items():
-        title = zoho_data["website_title"]
-        category = zoho_data["category"]
-        if not title:
-            continue
-
+    # Long form: one row per (product, parsed attribute), collected column-wise
+    # Products without a website title are dropped up front; a title that parses
+    # to nothing simply contributes no rows
+    titled = [
+        (sku, zoho_data["website_title"], zoho_data["category"])
+        for sku, zoho_data in zoho_titles.items()
+        if zoho_data["website_title"]
+    ]
+    skus, categories, titles, attributes, values = [], [], [], [], []
+    for sku, title, category in titled:
         parsed = parse_name(title, category)
-        if not parsed:
-            continue
-
-        web = web_attrs.get(sku, {})
-        google = google_attrs.get(sku, {})
-
-        for parsed_attr, parsed_val in parsed.items():
-            # Find matching actual attribute names
-            possible_names = ATTR_MAP.get(parsed_attr, [parsed_attr])
-
-            # Check Website
-            web_val = ""
-            for name in possible_names:
-                if name in web:
-                    web_val = web[name]
-                    break
-
-            # Check Google
-            google_val = ""
-            for name in possible_names:
-                if name in google:
-                    google_val = google[name]
-                    break
-
-            # Compare
-            web_match = _match_value(parsed_val, web_val) if web_val else None
-            google_match = _match_value(parsed_val, google_val) if google_val else None
-
-            # Only report mismatches or missing
-            has_issue = False
-            status = ""
-            if web_match is False or google_match is False:
-                has_issue = True
-                status = "MISMATCH"
-            elif web_match is None and google_match is None:
-                has_issue = True
-                status = "NOT FOUND"
-
-            if has_issue:
-                rows.append({
-                    "sku": sku,
-                    "category": category,
-                    "product_title": title[:80],
-                    "attribute": parsed_attr,
-                    "from_name": parsed_val,
-                    "website_value": web_val or "—",
-                    "google_value": google_val or "—",
-                    "status": status,
-                    "web_match": "Yes" if web_match else ("No" if web_match is False else "—"),
-                    "google_match": "Yes" if google_match else ("No" if google_match is False else "—"),
-                })
-
-    df = pd.DataFrame(rows)
-    if not df.empty:
-        df = df.sort_values(["category", "attribute", "sku"]).reset_index(drop=True)
-    return df
+        n = len(parsed)
+        skus += [sku] * n
+        categories += [category] * n
+        titles += [title[:80]] * n
+        attributes.extend(parsed)
+        values.extend(parsed.values())
+    if not skus:
+        return pd.DataFrame()
+    parsed = pd.DataFrame({
+        "sku": skus,
+        "category": categories,
+        "product_title": titles,
+        "attribute": attributes,
+        "from_name": values,
+    }).astype({"sku": KEY_DTYPE, "category": KEY_DTYPE, "attribute": KEY_DTYPE})
+
+    # Actual attribute name -> (parsed attribute, preference rank); attributes
+    # without an ATTR_MAP entry are looked up under their own name
+    targets = dict(_ALIAS_TARGETS)
+    for attr in parsed["attribute"].unique():
+        if attr not in ATTR_MAP:
+            targets[attr] = targets.get(attr, []) + [(attr, 0)]
+    web_val = _resolve_actual(parsed, targets, web_attrs)
+    google_val = _resolve_actual(parsed, targets, google_attrs)
+
+    # Compare — 1 match, 0 mismatch, -1 nothing to compare
+    web_match, google_match = _match_columns(parsed["from_name"], web_val, google_val)
+
+    # Only report mismatches or missing
+    mismatch = (web_match == 0) | (google_match == 0)
+    not_found = (web_match == -1) & (google_match == -1)
+    keep = mismatch | not_found
+    if not keep.any():
+        return pd.DataFrame()
+
+    labels = np.array(["Yes", "No", "—"], dtype=object)  # indexed by 1 - code
+    df = pd.DataFrame({
+        "sku": parsed["sku"].to_numpy(dtype=object)[keep],
+        "category": parsed["category"].to_numpy(dtype=object)[keep],
+        "product_title": parsed["product_title"].to_numpy()[keep],
+        "attribute": parsed["attribute"].to_numpy(dtype=object)[keep],
+        "from_name": parsed["from_name"].to_numpy()[keep],
+        "website_value": web_val.where(web_val != "", "—").to_numpy()[keep],
+        "google_value": google_val.where(google_val != "", "—").to_numpy()[keep],
+        "status": np.where(mismatch, "MISMATCH", "NOT FOUND")[keep],
+        "web_match": labels[1 - web_match[keep]],
+        "google_match": labels[1 - google_match[keep]],
+    })
+    # Sort by category, attribute, sku on sorted integer codes (few distinct
+    # categories/attributes); the columns themselves stay plain strings
+    keys = [pd.factorize(df[col], sort=True)[0] for col in ("sku", "attribute", "category")]
+    return df.take(np.lexsort(keys)).reset_index(drop=True)
+
+
+def _resolve_actual(parsed, targets, attrs):
+    """
+    Actual value for each parsed row: the first ATTR_MAP name present in the
+    product's source attributes ("" if none), resolved with a join instead of per-row lookups.
+    """
+    actual = pd.DataFrame(
+        [(sku, attr, rank, val)
+         for sku, sku_attrs in attrs.items()
+         for name, val in sku_attrs.items()
+         for attr, rank in targets.get(name, ())],
+        columns=["sku", "attribute", "rank", "value"],
+    ).astype({"sku": KEY_DTYPE, "attribute": KEY_DTYPE})
+    best = actual.sort_values("rank", kind="stable").drop_duplicates(["sku", "attribute"])
+    values = parsed[["sku", "attribute"]].merge(best, on=["sku", "attribute"], how="left")["value"]
+    return values.fillna("").set_axis(parsed.index)
+
+
+def _match_columns(parsed_vals, *actual_columns):
+    """_match_codes of parsed_vals against each actual column.
+
+    Values are factorized to integer codes first, so the work below runs once per
+    distinct (parsed, actual) pair and the result is broadcast back with numpy.
+    The cheap outcomes of _match_value (nothing to compare, equal after
+    normalization) are settled with array comparisons; only the remaining pairs
+    go through _match_value, split across worker processes when there are many.
+    """
+    p_codes, p_uniques = pd.factorize(np.asarray(parsed_vals, dtype=object), use_na_sentinel=False)
+    p_codes = p_codes.astype(np.int64)
+    p_norm = np.array([_normalize_value(v) for v in p_uniques], dtype=object)
+    parsed_raw, actual_raw, parsed_norm, actual_norm, inverses, n_pairs = [], [], [], [], [], []
+    for col in actual_columns:
+        a_codes, a_uniques = pd.factorize(np.asarray(col, dtype=object), use_na_sentinel=False)
+        a_norm = np.array([_normalize_value(v) for v in a_uniques], dtype=object)
+        pairs, inverse = np.unique(p_codes * len(a_uniques) + a_codes, return_inverse=True)
+        p_idx, a_idx = pairs // len(a_uniques), pairs % len(a_uniques)
+        parsed_raw.append(p_uniques[p_idx])
+        actual_raw.append(a_uniques[a_idx])
+        parsed_norm.append(p_norm[p_idx])
+        actual_norm.append(a_norm[a_idx])
+        inverses.append(inverse)
+        n_pairs.append(len(pairs))
+    parsed_raw, actual_raw = np.concatenate(parsed_raw), np.concatenate(actual_raw)
+    parsed_norm, actual_norm = np.concatenate(parsed_norm), np.concatenate(actual_norm)
+
+    codes = np.full(len(parsed_raw), -1, dtype=np.int8)
+    comparable = (actual_raw != "") & (parsed_norm != "") & (actual_norm != "")
+    equal = comparable & (parsed_norm == actual_norm)
+    codes[equal] = 1
+    pending = np.flatnonzero(comparable & ~equal)
+
+    todo_parsed, todo_actual = list(parsed_raw[pending]), list(actual_raw[pending])
+    if len(pending) < PARALLEL_MIN_ROWS:
+        codes[pending] = _match_codes(todo_parsed, todo_actual)
+    else:
+        n_chunks = os.cpu_count() or 1
+        bounds = np.linspace(0, len(pending), n_chunks + 1, dtype=int)
+        spans = list(zip(bounds[:-1], bounds[1:]))
+        with ProcessPoolExecutor() as ex:
+            codes[pending] = np.concatenate(list(ex.map(
+                _match_codes,
+                [todo_parsed[a:b] for a, b in spans],
+                [todo_actual[a:b] for a, b in spans],
+            )))
+
+    # Split the per-pair codes back per column and expand to one code per row
+    offsets = np.cumsum([0] + n_pairs)
+    return [codes[start:end][inverse] for start, end, inverse in zip(offsets[:-1], offsets[1:], inverses)]
+
+
+def _match_codes(parsed_vals, actual_vals):
+    """_match_value over aligned columns as int8 codes: 1 match, 0 mismatch, -1 not comparable."""
+    codes = {True: 1, False: 0, None: -1}
+    return np.fromiter(
+        (codes[_match_value(p, a)] if a else -1 for p, a in zip(parsed_vals, actual_vals)),
+        dtype=np.int8, count=len(parsed_vals),
+    )
@@ -2,10 +2,26 @@
 Report generation: console output + Excel with tabs.
 """
 
+import io
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 import pandas as pd
+from openpyxl import Workbook
 import config
 
+# xlsxwriter is much faster than openpyxl for large sheets; it is optional,
+# openpyxl stays the fallback. (Not in constant_memory mode: to_excel writes
+# column by column, and that mode drops cells of rows it has already flushed.)
+EXCEL_ENGINE = "xlsxwriter" if find_spec("xlsxwriter") else "openpyxl"
+
+ALL_PRODUCTS_PREVIEW_ROWS = 1000
+
+# Columns of the merged table that go to the "All Products" tab ({} = source name);
+# the in_<source> flags only feed the counting logic and are left out
+EXCEL_MERGED_COLUMNS = ["sku", "name_{}", "price_{}", "sale_price_{}", "category_{}", "status_{}"]
+
 
 def print_summary(results):
     """Print summary to console."""
@@ -16,49 +32,53 @@ def print_summary(results):
     name_diff = results["name_differences"]
     attr_diff = results.get("attribute_differences", pd.DataFrame())
 
-    print("\n" + "=" * 60)
-    print("COMPARISON SUMMARY")
-    print("=" * 60)
+    # Build the whole summary in memory and write it to stdout once
+    buf = io.StringIO()
+
+    print("\n" + "=" * 60, file=buf)
+    print("COMPARISON SUMMARY", file=buf)
+    print("=" * 60, file=buf)
 
-    print(f"\nSources:")
+    print(f"\nSources:", file=buf)
     for name, df in sources.items():
-        print(f"  - {name}: {len(df)} products")
+        print(f"  - {name}: {len(df)} products", file=buf)
 
-    print(f"\nTotal unique SKUs: {len(merged)}")
+    print(f"\nTotal unique SKUs: {len(merged)}", file=buf)
 
     # Count products present in all sources
     source_names = list(sources.keys())
     if source_names:
-        in_all = merged
-        for s in source_names:
-            in_all = in_all[in_all[f"in_{s}"] == True]
-        print(f"Products in all sources: {len(in_all)}")
-
-    print(f"\nDiscrepancies:")
-    print(f"  - Missing products: {len(missing)}")
-    print(f"  - Price differences: {len(price_diff)}")
-    print(f"  - Name differences: {len(name_diff)}")
+        in_all = merged[[f"in_{s}" for s in source_names]].to_numpy(dtype=bool).all(axis=1)
+        print(f"Products in all sources: {int(in_all.sum())}", file=buf)
+
+    print(f"\nDiscrepancies:", file=buf)
+    print(f"  - Missing products: {len(missing)}", file=buf)
+    print(f"  - Price differences: {len(price_diff)}", file=buf)
+    print(f"  - Name differences: {len(name_diff)}", file=buf)
     if not attr_diff.empty:
         unique_skus = attr_diff["sku"].nunique()
-        print(f"  - Attribute differences: {len(attr_diff)} ({unique_skus} products)")
+        print(f"  - Attribute differences: {len(attr_diff)} ({unique_skus} products)", file=buf)
 
     if not price_diff.empty:
-        print(f"\nTop 5 largest price discrepancies:")
+        print(f"\nTop 5 largest price discrepancies:", file=buf)
         top = price_diff.nlargest(5, "price_diff")
-        for _, row in top.iterrows():
+        price_vals = top[[f"price_{s}" for s in source_names]].to_numpy()
+        has_price = pd.notna(price_vals)
+        for i, row in enumerate(top.itertuples(index=False)):
             prices = " | ".join(
-                f"{s}: ${row.get(f'price_{s}', 'N/A')}"
-                for s in source_names
-                if pd.notna(row.get(f"price_{s}"))
+                f"{s}: ${price_vals[i, j]}"
+                for j, s in enumerate(source_names)
+                if has_price[i, j]
             )
-            print(f"  SKU: {row['sku']} — {row['product_name'][:50]}")
-            print(f"    {prices}  (difference: ${row['price_diff']})")
+            print(f"  SKU: {row.sku} — {row.product_name[:50]}", file=buf)
+            print(f"    {prices}  (difference: ${row.price_diff})", file=buf)
 
-    print("=" * 60)
+    print("=" * 60, file=buf)
+    sys.stdout.write(buf.getvalue())
 
 
-def export_excel(results, output_path=None):
-    """Export detailed report to Excel."""
+def export_excel(results, output_path=None, raw_format="csv"):
+    """Export detailed report to Excel (raw source data as CSV sidecars, or tabs with raw_format="excel")."""
     output_path = output_path or config.REPORT_FILE
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
@@ -69,64 +89,116 @@ def export_excel(results, output_path=None):
     name_diff = results["name_differences"]
     attr_diff = results.get("attribute_differences", pd.DataFrame())
 
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        # "Summary" tab
-        source_names = list(sources.keys())
-        summary_data = {
-            "Metric": [
-                "Total unique SKUs",
-                "Missing products",
-                "Price discrepancies",
-                "Name discrepancies",
-                "Attribute discrepancies",
-            ],
-            "Value": [
-                len(merged),
-                len(missing),
-                len(price_diff),
-                len(name_diff),
-                len(attr_diff),
-            ],
-        }
-        for name, df in sources.items():
-            summary_data["Metric"].append(f"Products in {name}")
-            summary_data["Value"].append(len(df))
-
-        pd.DataFrame(summary_data).to_excel(writer, sheet_name="Summary", index=False)
-
-        # "All Products" tab
-        if not merged.empty:
-            merged.to_excel(writer, sheet_name="All Products", index=False)
-
-        # "Price Discrepancies" tab
-        if not price_diff.empty:
-            price_diff.to_excel(writer, sheet_name="Price Discrepancies", index=False)
+    output_dir = os.path.dirname(output_path)
+
+    # All products — the full table goes to a CSV next to the report (slow to
+    # write as xlsx) and the tab shows a preview; raw_format="excel" keeps the full tab
+    csv_files = []  # (path, frame), written alongside the workbook
+    all_products_path = None
+    if not merged.empty and raw_format != "excel":
+        all_products_path = os.path.join(output_dir, "all_products.csv")
+        csv_files.append((all_products_path, merged))
+
+    # (sheet name, frame, freeze header row) in tab order
+    sheets = []
+
+    # "Summary" tab — (metric, value) pairs, so labels and values cannot drift apart
+    summary = [
+        ("Total unique SKUs", len(merged)),
+        ("Missing products", len(missing)),
+        ("Price discrepancies", len(price_diff)),
+        ("Name discrepancies", len(name_diff)),
+        ("Attribute discrepancies", len(attr_diff)),
+    ] + [(f"Products in {name}", len(df)) for name, df in sources.items()]
+    sheets.append(("Summary", pd.DataFrame(summary, columns=["Metric", "Value"]), False))
+
+    # "All Products" tab
+    merged_for_excel = _merged_for_excel(merged, list(sources.keys()))
+    if all_products_path:
+        sheets.append(("All Products (preview)", merged_for_excel.head(ALL_PRODUCTS_PREVIEW_ROWS), True))
+    elif not merged.empty:
+        sheets.append(("All Products", merged_for_excel, True))
+
+    # "Price Discrepancies" tab
+    if not price_diff.empty:
+        sheets.append(("Price Discrepancies", price_diff, False))
 
-        # "Missing Products" tab
-        if not missing.empty:
-            missing.to_excel(writer, sheet_name="Missing Products", index=False)
+    # "Missing Products" tab
+    if not missing.empty:
+        sheets.append(("Missing Products", missing, False))
 
-        # "Name Discrepancies" tab
-        if not name_diff.empty:
-            name_diff.to_excel(writer, sheet_name="Name Discrepancies", index=False)
+    # "Name Discrepancies" tab
+    if not name_diff.empty:
+        sheets.append(("Name Discrepancies", name_diff, False))
 
-        # "Attribute Discrepancies" tab
-        if not attr_diff.empty:
-            attr_diff.to_excel(writer, sheet_name="Attr Discrepancies", index=False)
+    # "Attribute Discrepancies" tab
+    if not attr_diff.empty:
+        sheets.append(("Attr Discrepancies", attr_diff, False))
 
-        # "Name vs Attributes" tab
-        name_vs_attrs = results.get("name_vs_attributes", pd.DataFrame())
-        if not name_vs_attrs.empty:
-            name_vs_attrs.to_excel(writer, sheet_name="Name vs Attributes", index=False)
+    # "Name vs Attributes" tab
+    name_vs_attrs = results.get("name_vs_attributes", pd.DataFrame())
+    if not name_vs_attrs.empty:
+        sheets.append(("Name vs Attributes", name_vs_attrs, False))
 
-        # Tabs with raw data from each source
+    # Raw data from each source — CSV files next to the report by default
+    # (large frames are slow to write as xlsx); raw_format="excel" keeps them as tabs
+    if raw_format == "excel":
         for name, df in sources.items():
             sheet_name = f"Source_{name}"[:31]  # Excel sheet name length limit
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
+            sheets.append((sheet_name, df, True))
+    else:
+        raw_files = {"Source": [], "Products": [], "File": []}
+        for name, df in sources.items():
+            csv_path = os.path.join(output_dir, f"source_{name}.csv")
+            csv_files.append((csv_path, df))
+            raw_files["Source"].append(name)
+            raw_files["Products"].append(len(df))
+            raw_files["File"].append(os.path.basename(csv_path))
+        if all_products_path:
+            raw_files["Source"].append("all products")
+            raw_files["Products"].append(len(merged))
+            raw_files["File"].append(os.path.basename(all_products_path))
+        sheets.append(("Sources", pd.DataFrame(raw_files), False))
+
+    # The CSV files are independent of the workbook — write them on worker
+    # threads while the (single-threaded) xlsx serialization runs here
+    with ThreadPoolExecutor() as pool:
+        csv_writes = [pool.submit(df.to_csv, path, index=False, encoding="utf-8")
+                      for path, df in csv_files]
+        if EXCEL_ENGINE == "xlsxwriter":
+            with pd.ExcelWriter(output_path, engine=EXCEL_ENGINE) as writer:
+                for sheet_name, df, freeze in sheets:
+                    df.to_excel(writer, sheet_name=sheet_name, index=False,
+                                freeze_panes=(1, 0) if freeze else None)
+        else:
+            _write_excel_openpyxl(output_path, sheets)
+        for write in csv_writes:
+            write.result()
 
     print(f"\nReport saved: {output_path}")
 
 
+def _merged_for_excel(merged, source_names):
+    """Project the merged table onto EXCEL_MERGED_COLUMNS, keeping its column order."""
+    keep = {col.format(s) for col in EXCEL_MERGED_COLUMNS for s in source_names}
+    return merged[[col for col in merged.columns if col in keep]]
+
+
+def _write_excel_openpyxl(output_path, sheets):
+    """Write sheets through an openpyxl write-only workbook (rows are streamed, no Cell objects)."""
+    wb = Workbook(write_only=True)
+    for sheet_name, df, freeze in sheets:
+        ws = wb.create_sheet(sheet_name)
+        if freeze:
+            ws.freeze_panes = "A2"
+        ws.append([str(col) for col in df.columns])
+        # Missing values (NaN/None/NA) become empty cells, as with DataFrame.to_excel
+        values = df.astype(object).where(df.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            ws.append(row)
+    wb.save(output_path)
+
+
 def generate_report(results):
     """Generate full report (console + Excel)."""
     print("\n3. Generating report...")
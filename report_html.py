@@ -3,19 +3,28 @@ Generation of a polished HTML product comparison report.
 """
 
 import os
+import re
+import gzip
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from html import unescape as _html_unescape
 import pandas as pd
 import config
+import comparator
+import loaders
+import name_parser
+
+
+def _cached_attrs(cache, name, path, loader):
+    """Return cache[name] if the source file is unchanged since it was parsed, else reload."""
+    return comparator.cached(cache, name, (path, comparator.file_stamp(path)), loader)
 
 
 def _load_zoho_attributes():
     """Load attributes from Zoho API cache."""
-    cache_path = os.path.join(config.DATA_DIR, "zoho_api_cache.json")
-    if not os.path.exists(cache_path):
-        return {}
-
-    with open(cache_path, "r", encoding="utf-8") as f:
-        items = json.load(f)
+    # Shared with name_parser: parsed with orjson when installed, once per file change
+    items = name_parser._load_zoho_items()
 
     attrs = {}
     for item in items:
@@ -42,31 +51,53 @@ def _load_zoho_attributes():
     return attrs
 
 
+_WEBSITE_COLUMNS = {"SKU", "Sale price", "Short description", "Weight (lbs)"} | {
+    col for i in range(1, 24) for col in (f"Attribute {i} name", f"Attribute {i} value(s)")
+}
+
+
 def _load_website_attributes():
     """Load attributes from WooCommerce CSV."""
-    df = pd.read_csv(config.WEBSITE_CSV, dtype=str, low_memory=False)
+    # Only the columns used below — the export is much wider — read in chunks
+    # so only one chunk of rows is in memory next to the attrs dict
+    chunks = pd.read_csv(config.WEBSITE_CSV, dtype=str, low_memory=False,
+                         usecols=lambda c: c in _WEBSITE_COLUMNS, chunksize=loaders.CSV_CHUNK_ROWS)
     attrs = {}
+    for df in chunks:
+        if "SKU" not in df.columns:
+            break
+        _add_website_attributes(attrs, df)
+    return attrs
+
 
-    for _, row in df.iterrows():
-        sku = str(row.get("SKU", "")).strip().upper()
+def _add_website_attributes(attrs, df):
+    """Add the attributes of one chunk of WooCommerce rows to attrs (later rows win)."""
+    # Whole columns as plain Python lists — no per-row Series
+    skus = df["SKU"].astype(str).str.strip().str.upper().tolist()
+    cols = ["Sale price", "Short description", "Weight (lbs)"]
+    for i in range(1, 24):
+        if f"Attribute {i} name" in df.columns:
+            cols += [f"Attribute {i} name", f"Attribute {i} value(s)"]
+    values = df.reindex(columns=cols, fill_value="")
+    records = values.to_numpy(dtype=object).tolist()
+    present = values.notna().to_numpy().tolist()
+
+    for sku, row, has in zip(skus, records, present):
         if not sku:
             continue
 
         item_attrs = {
-            "sale_price": row.get("Sale price", ""),
-            "short_description": str(row.get("Short description", ""))[:200],
-            "weight": row.get("Weight (lbs)", ""),
+            "sale_price": row[0],
+            "short_description": str(row[1])[:200],
+            "weight": row[2],
         }
 
-        # Dynamic attributes
-        for i in range(1, 24):
-            name_col = f"Attribute {i} name"
-            val_col = f"Attribute {i} value(s)"
-            if name_col in df.columns and pd.notna(row.get(name_col)):
-                item_attrs[row[name_col]] = row.get(val_col, "")
+        # Dynamic attributes — (name, value) column pairs
+        for j in range(3, len(row), 2):
+            if has[j]:
+                item_attrs[row[j]] = row[j + 1]
 
         attrs[sku] = item_attrs
-    return attrs
 
 
 def _load_google_attributes():
@@ -78,9 +109,9 @@ def _load_google_attributes():
     attrs = {}
 
     if path.endswith(".xlsx") or path.endswith(".xls"):
-        xls = pd.ExcelFile(path)
-        for sheet in xls.sheet_names:
-            df = pd.read_excel(xls, sheet_name=sheet, dtype=str)
+        # All sheets in one read_excel call (one read-only openpyxl workbook)
+        sheets = pd.read_excel(path, sheet_name=None, dtype=str)
+        for sheet, df in sheets.items():
             df.columns = [c.strip() for c in df.columns]
             # Find SKU column
             sku_col = "SKU" if "SKU" in df.columns else None
@@ -92,31 +123,42 @@ def _load_google_attributes():
             if not sku_col:
                 continue
 
-            for _, row in df.iterrows():
-                sku = str(row.get(sku_col, "")).strip().upper()
+            # Clean column names once: remove /NA, /Filter suffixes for display
+            sku_pos = list(df.columns).index(sku_col)
+            attr_cols = [(j, col.replace("/NA", "").replace("/Filter", "").strip())
+                         for j, col in enumerate(df.columns) if col != sku_col]
+            values = df.to_numpy(dtype=object).tolist()
+            present = df.notna().to_numpy().tolist()
+
+            for row, has in zip(values, present):
+                sku = str(row[sku_pos]).strip().upper()
                 if not sku or sku == "NAN":
                     continue
                 item_attrs = {"Sheet": sheet}
-                for col in df.columns:
-                    if col == sku_col:
-                        continue
-                    val = row.get(col, "")
-                    if pd.notna(val) and str(val).strip() and str(val).strip().lower() != "nan":
-                        # Clean column name: remove /NA, /Filter suffixes for display
-                        clean_name = col.replace("/NA", "").replace("/Filter", "").strip()
-                        item_attrs[clean_name] = str(val).strip()
+                for j, clean_name in attr_cols:
+                    if has[j]:
+                        val = str(row[j]).strip()
+                        if val and val.lower() != "nan":
+                            item_attrs[clean_name] = val
                 attrs[sku] = item_attrs
     else:
         df = pd.read_csv(path, dtype=str)
-        for _, row in df.iterrows():
-            sku = str(row.get("SKU", "")).strip().upper()
+        if "SKU" not in df.columns:
+            return attrs
+        # SKUs normalized as a whole column; rows as plain lists with a notna mask
+        skus = df["SKU"].astype(str).str.strip().str.upper().tolist()
+        columns = list(df.columns)
+        values = df.to_numpy(dtype=object).tolist()
+        present = df.notna().to_numpy().tolist()
+        for sku, row, has in zip(skus, values, present):
             if not sku:
                 continue
             item_attrs = {}
-            for col in df.columns:
-                val = row.get(col, "")
-                if pd.notna(val) and str(val).strip():
-                    item_attrs[col] = str(val).strip()
+            for col, val, ok in zip(columns, row, has):
+                if ok:
+                    val = str(val).strip()
+                    if val:
+                        item_attrs[col] = val
             attrs[sku] = item_attrs
 
     return attrs
@@ -127,6 +169,36 @@ def generate_html(results, output_path=None):
     output_path = output_path or os.path.join(config.OUTPUT_DIR, "comparison_report.html")
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
+    # Attributes are re-parsed only when their source file changed; the three
+    # sources are independent, so they load concurrently
+    print("  Loading attributes...")
+    cache = comparator.load_cache("report_attrs_cache.pkl")
+    with ThreadPoolExecutor(3) as pool:
+        zoho_f = pool.submit(_cached_attrs, cache, "zoho", os.path.join(config.DATA_DIR, "zoho_api_cache.json"),
+                             _load_zoho_attributes)
+        web_f = pool.submit(_cached_attrs, cache, "website", config.WEBSITE_CSV, _load_website_attributes)
+        google_f = pool.submit(_cached_attrs, cache, "google", config.GOOGLE_XLSX, _load_google_attributes)
+    zoho_attrs, web_attrs, google_attrs = zoho_f.result(), web_f.result(), google_f.result()
+    comparator.save_cache("report_attrs_cache.pkl", cache)
+
+    # The stylesheet is static — a shared file next to the report
+    _write_asset(os.path.join(os.path.dirname(output_path), "report.css"), REPORT_CSS)
+
+    # The page goes to disk section by section as it is rendered, together with
+    # a gzipped copy a web server can send pre-compressed (mtime=0: same report,
+    # same bytes); like the page, it needs report.css beside it
+    with open(output_path, "w", encoding="utf-8") as f, \
+            gzip.GzipFile(output_path + ".gz", "wb", compresslevel=6, mtime=0) as gz:
+        for part in _render_html(results, zoho_attrs, web_attrs, google_attrs):
+            f.write(part)
+            gz.write(part.encode("utf-8"))
+
+    print(f"  HTML report: {output_path}")
+    return output_path
+
+
+def _render_html(results, zoho_attrs, web_attrs, google_attrs):
+    """Yield the HTML report in sections: header and stats, then one per tab."""
     sources = results["sources"]
     merged = results["merged"]
     missing = results["missing"]
@@ -136,11 +208,6 @@ def generate_html(results, output_path=None):
     name_vs_attrs = results.get("name_vs_attributes", pd.DataFrame())
     source_names = list(sources.keys())
 
-    print("  Loading attributes...")
-    zoho_attrs = _load_zoho_attributes()
-    web_attrs = _load_website_attributes()
-    google_attrs = _load_google_attributes()
-
     # Statistics
     total_skus = len(merged)
     in_all = merged
@@ -148,222 +215,20 @@ def generate_html(results, output_path=None):
         in_all = in_all[in_all[f"in_{s}"] == True]
     in_all_count = len(in_all)
 
-    html = f"""<!DOCTYPE html>
+    # Zoho status per merged row ("" when absent) and by SKU for the other tabs
+    if "status_zoho" in merged.columns:
+        zoho_statuses = merged["status_zoho"].astype(object).fillna("").astype(str).tolist()
+    else:
+        zoho_statuses = [""] * len(merged)
+    sku_to_status = dict(zip(merged.get("sku", []), zoho_statuses))
+
+    out = [f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width, initial-scale=1.0">
 <title>Product Comparison — JM Attachments</title>
-<style>
-  :root {{
-    --bg: #0f172a;
-    --card: #1e293b;
-    --border: #334155;
-    --text: #e2e8f0;
-    --muted: #94a3b8;
-    --accent: #3b82f6;
-    --green: #22c55e;
-    --red: #ef4444;
-    --orange: #f59e0b;
-    --purple: #a78bfa;
-  }}
-  * {{ margin:0; padding:0; box-sizing:border-box; }}
-  body {{
-    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, sans-serif;
-    background: var(--bg);
-    color: var(--text);
-    line-height: 1.5;
-    padding: 20px;
-  }}
-  .container {{ max-width: 1600px; margin: 0 auto; }}
-  h1 {{
-    font-size: 1.75rem;
-    font-weight: 700;
-    margin-bottom: 8px;
-  }}
-  .subtitle {{ color: var(--muted); margin-bottom: 24px; }}
-
-  /* Stats cards */
-  .stats {{
-    display: grid;
-    grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-    gap: 12px;
-    margin-bottom: 32px;
-  }}
-  .stat-card {{
-    background: var(--card);
-    border: 1px solid var(--border);
-    border-radius: 12px;
-    padding: 16px 20px;
-  }}
-  .stat-card .num {{
-    font-size: 2rem;
-    font-weight: 700;
-    line-height: 1.2;
-  }}
-  .stat-card .label {{ color: var(--muted); font-size: 0.85rem; }}
-  .stat-card.green .num {{ color: var(--green); }}
-  .stat-card.red .num {{ color: var(--red); }}
-  .stat-card.orange .num {{ color: var(--orange); }}
-  .stat-card.blue .num {{ color: var(--accent); }}
-  .stat-card.purple .num {{ color: var(--purple); }}
-
-  /* Tabs */
-  .tabs {{
-    display: flex;
-    gap: 4px;
-    margin-bottom: 0;
-    border-bottom: 2px solid var(--border);
-    padding-bottom: 0;
-  }}
-  .tab {{
-    padding: 10px 20px;
-    cursor: pointer;
-    border-radius: 8px 8px 0 0;
-    background: transparent;
-    color: var(--muted);
-    border: 1px solid transparent;
-    border-bottom: none;
-    font-size: 0.9rem;
-    font-weight: 500;
-    transition: all 0.15s;
-    position: relative;
-    bottom: -2px;
-  }}
-  .tab:hover {{ color: var(--text); background: var(--card); }}
-  .tab.active {{
-    color: var(--accent);
-    background: var(--card);
-    border-color: var(--border);
-  }}
-  .tab .badge {{
-    background: var(--border);
-    color: var(--muted);
-    padding: 2px 8px;
-    border-radius: 10px;
-    font-size: 0.75rem;
-    margin-left: 6px;
-  }}
-  .tab.active .badge {{ background: rgba(59,130,246,0.2); color: var(--accent); }}
-
-  .tab-content {{ display: none; }}
-  .tab-content.active {{ display: block; }}
-
-  /* Tables */
-  .table-wrap {{
-    background: var(--card);
-    border: 1px solid var(--border);
-    border-radius: 0 12px 12px 12px;
-    overflow: hidden;
-    margin-bottom: 32px;
-  }}
-  .search-bar {{
-    padding: 12px 16px;
-    border-bottom: 1px solid var(--border);
-  }}
-  .search-bar input {{
-    width: 100%;
-    max-width: 400px;
-    padding: 8px 12px;
-    border-radius: 8px;
-    border: 1px solid var(--border);
-    background: var(--bg);
-    color: var(--text);
-    font-size: 0.9rem;
-  }}
-  .search-bar input::placeholder {{ color: var(--muted); }}
-  table {{
-    width: 100%;
-    border-collapse: collapse;
-    font-size: 0.85rem;
-  }}
-  thead th {{
-    background: rgba(0,0,0,0.2);
-    padding: 10px 12px;
-    text-align: left;
-    font-weight: 600;
-    color: var(--muted);
-    text-transform: uppercase;
-    font-size: 0.75rem;
-    letter-spacing: 0.05em;
-    border-bottom: 1px solid var(--border);
-    position: sticky;
-    top: 0;
-    white-space: nowrap;
-  }}
-  td {{
-    padding: 8px 12px;
-    border-bottom: 1px solid var(--border);
-    vertical-align: top;
-  }}
-  tr:hover {{ background: rgba(255,255,255,0.03); }}
-  .scrollable {{ max-height: 70vh; overflow-y: auto; }}
-
-  /* Tags */
-  .tag {{
-    display: inline-block;
-    padding: 2px 8px;
-    border-radius: 6px;
-    font-size: 0.75rem;
-    font-weight: 500;
-  }}
-  .tag-zoho {{ background: rgba(59,130,246,0.15); color: #60a5fa; }}
-  .tag-website {{ background: rgba(34,197,94,0.15); color: #4ade80; }}
-  .tag-google {{ background: rgba(168,85,247,0.15); color: #c084fc; }}
-  .tag-yes {{ background: rgba(34,197,94,0.15); color: #4ade80; }}
-  .tag-no {{ background: rgba(239,68,68,0.15); color: #f87171; }}
-
-  .price {{ font-family: 'SF Mono', Monaco, monospace; }}
-  .price-diff {{ color: var(--red); font-weight: 600; }}
-  .price-match {{ color: var(--green); }}
-  .text-muted {{ color: var(--muted); }}
-  .text-warn {{ color: var(--orange); }}
-
-  /* Attribute comparison */
-  .attr-table {{ margin-top: 4px; }}
-  .attr-table td {{
-    padding: 2px 8px;
-    border: none;
-    font-size: 0.8rem;
-  }}
-  .attr-label {{ color: var(--muted); white-space: nowrap; }}
-  .attr-diff {{ background: rgba(239,68,68,0.1); border-radius: 4px; }}
-
-  /* Expand row */
-  .expand-btn {{
-    cursor: pointer;
-    color: var(--accent);
-    font-size: 0.8rem;
-    text-decoration: none;
-    user-select: none;
-  }}
-  .expand-btn:hover {{ text-decoration: underline; }}
-  .detail-row {{ display: none; }}
-  .detail-row.open {{ display: table-row; }}
-  .detail-cell {{
-    padding: 12px 24px;
-    background: rgba(0,0,0,0.15);
-  }}
-  .detail-grid {{
-    display: grid;
-    grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-    gap: 16px;
-  }}
-  .detail-source {{
-    border: 1px solid var(--border);
-    border-radius: 8px;
-    padding: 12px;
-  }}
-  .detail-source h4 {{
-    font-size: 0.85rem;
-    margin-bottom: 8px;
-    display: flex;
-    align-items: center;
-    gap: 8px;
-  }}
-  .detail-source table {{ font-size: 0.8rem; }}
-  .detail-source td {{ padding: 3px 8px; border: none; }}
-</style>
+<link rel="stylesheet" href="report.css">
 </head>
 <body>
 <div class="container">
@@ -399,17 +264,17 @@ def generate_html(results, output_path=None):
       <div class="num" style="color: #f472b6;">{len(name_vs_attrs)}</div>
       <div class="label">Name vs Attributes</div>
     </div>
-"""
+"""]
 
     for name, df in sources.items():
         tag = name
-        html += f"""    <div class="stat-card">
+        out.append(f"""    <div class="stat-card">
       <div class="num">{len(df)}</div>
       <div class="label"><span class="tag tag-{tag}">{name.upper()}</span></div>
     </div>
-"""
+""")
 
-    html += """  </div>
+    out.append("""  </div>
 
   <!-- Tabs -->
   <div class="tabs">
@@ -420,10 +285,12 @@ def generate_html(results, output_path=None):
     <div class="tab" onclick="showTab('namecheck')">Name vs Attributes<span class="badge">""" + str(len(name_vs_attrs)) + """</span></div>
     <div class="tab" onclick="showTab('all')">All Products<span class="badge">""" + str(total_skus) + """</span></div>
   </div>
-"""
+""")
+
+    yield "".join(out)
 
     # === TAB: Price Differences ===
-    html += """
+    out = ["""
   <div class="tab-content active" id="tab-prices">
     <div class="table-wrap">
       <div class="search-bar"><input type="text" placeholder="Search by SKU or product name..." onkeyup="filterTable(this, 'price-table')"></div>
@@ -432,44 +299,50 @@ def generate_html(results, output_path=None):
           <thead><tr>
             <th>SKU</th>
             <th>Product Name</th>
-"""
+"""]
     for s in source_names:
-        html += f'            <th>Price {s.upper()}</th>\n'
-    html += """            <th>Zoho Status</th>
+        out.append(f'            <th>Price {s.upper()}</th>\n')
+    out.append("""            <th>Zoho Status</th>
             <th>Difference</th>
             <th>Details</th>
           </tr></thead>
           <tbody>
-"""
+""")
 
+    rows = []
     if not price_diff.empty:
-        for idx, row in price_diff.iterrows():
-            sku = str(row.get("sku", ""))
-            name = str(row.get("product_name", ""))[:80]
-            diff = row.get("price_diff", 0)
-            zoho_status = _get_zoho_status(sku, merged)
+        for row in price_diff.itertuples():
+            sku = str(getattr(row, "sku", ""))
+            name = str(getattr(row, "product_name", ""))[:80]
+            diff = getattr(row, "price_diff", 0)
+            zoho_status = sku_to_status.get(sku, "")
 
-            html += f'          <tr>\n            <td><strong>{_esc(sku)}</strong></td>\n            <td>{_esc(name)}</td>\n'
+            tr = [f'<tr><td><strong>{_esc(sku)}</strong></td><td>{_esc(name)}</td>']
             for s in source_names:
-                p = row.get(f"price_{s}")
-                html += f'            <td class="price">{_fmt_price(p)}</td>\n'
-            html += f'            <td>{_fmt_status(zoho_status)}</td>\n'
-            html += f'            <td class="price price-diff">${diff:,.2f}</td>\n'
-            html += f'            <td><span class="expand-btn" onclick="toggleDetail(\'pd-{idx}\')">&#9660; attributes</span></td>\n'
-            html += '          </tr>\n'
+                p = getattr(row, f"price_{s}")
+                tr.append(f'<td class="price">{_fmt_price(p)}</td>')
+            tr.append(f'<td>{_fmt_status(zoho_status)}</td>')
+            tr.append(f'<td class="price price-diff">{_fmt_amount(float(diff))}</td>')
+            tr.append(f'<td><span class="expand-btn" onclick="toggleDetail(\'pd-{row.Index}\')">&#9660; attributes</span></td>')
+            tr.append('</tr>')
 
             # Detail row
-            html += _build_detail_row(f"pd-{idx}", sku, source_names, zoho_attrs, web_attrs, google_attrs)
+            detail = _build_detail_row(f"pd-{row.Index}", sku)
+            rows.append(_paged_row(tr, detail))
 
-    html += """          </tbody>
+    out.append("""          </tbody>
         </table>
       </div>
-    </div>
+""")
+    out.append(_paged_table("price-table", rows))
+    out.append("""    </div>
   </div>
-"""
+""")
+
+    yield "".join(out)
 
     # === TAB: Missing ===
-    html += """
+    out = ["""
   <div class="tab-content" id="tab-missing">
     <div class="table-wrap">
       <div class="search-bar"><input type="text" placeholder="Search..." onkeyup="filterTable(this, 'missing-table')"></div>
@@ -478,71 +351,77 @@ def generate_html(results, output_path=None):
           <thead><tr>
             <th>SKU</th>
             <th>Product Name</th>
-"""
+"""]
     for s in source_names:
-        html += f'            <th>{s.upper()}</th>\n'
-    html += """            <th>Zoho Status</th>
+        out.append(f'            <th>{s.upper()}</th>\n')
+    out.append("""            <th>Zoho Status</th>
             <th>Details</th>
           </tr></thead>
           <tbody>
-"""
+""")
 
     if not missing.empty:
-        for idx, row in missing.iterrows():
-            sku = str(row.get("sku", ""))
-            name = str(row.get("product_name", ""))[:80]
-            present = str(row.get("present_in", "")).split(", ")
-            zoho_status = str(row.get("zoho_status", "")) if pd.notna(row.get("zoho_status")) else ""
+        missing_statuses = missing["zoho_status"].astype(object).fillna("").astype(str).tolist()
+        for row, zoho_status in zip(missing.itertuples(), missing_statuses):
+            sku = str(getattr(row, "sku", ""))
+            name = str(getattr(row, "product_name", ""))[:80]
+            present = str(getattr(row, "present_in", "")).split(", ")
 
-            html += f'          <tr>\n            <td><strong>{_esc(sku)}</strong></td>\n            <td>{_esc(name)}</td>\n'
+            td = [f'<td><strong>{_esc(sku)}</strong></td><td>{_esc(name)}</td>']
             for s in source_names:
                 if s in present:
-                    html += '            <td><span class="tag tag-yes">Yes</span></td>\n'
+                    td.append('<td><span class="tag tag-yes">Yes</span></td>')
                 else:
-                    html += '            <td><span class="tag tag-no">No</span></td>\n'
-            html += f'            <td>{_fmt_status(zoho_status)}</td>\n'
-            html += f'            <td><span class="expand-btn" onclick="toggleDetail(\'ms-{idx}\')">&#9660; attributes</span></td>\n'
-            html += '          </tr>\n'
-            html += _build_detail_row(f"ms-{idx}", sku, source_names, zoho_attrs, web_attrs, google_attrs)
-
-    html += """          </tbody>
+                    td.append('<td><span class="tag tag-no">No</span></td>')
+            td.append(f'<td>{_fmt_status(zoho_status)}</td>')
+            td.append(f'<td><span class="expand-btn" onclick="toggleDetail(\'ms-{row.Index}\')">&#9660; attributes</span></td>')
+            cells = "".join(td)
+            # The search box matches data-search instead of reading the row's text
+            out.append(f'          <tr data-search="{_esc(_search_text(cells))}">{cells}</tr>\n')
+            out.append(_build_detail_row(f"ms-{row.Index}", sku))
+
+    out.append("""          </tbody>
         </table>
       </div>
     </div>
   </div>
-"""
+""")
+
+    yield "".join(out)
 
     # === TAB: Name Differences ===
-    html += """
+    out = ["""
   <div class="tab-content" id="tab-names">
     <div class="table-wrap">
       <div class="scrollable">
         <table>
           <thead><tr>
             <th>SKU</th>
-"""
+"""]
     for s in source_names:
-        html += f'            <th>Name in {s.upper()}</th>\n'
-    html += """          </tr></thead>
+        out.append(f'            <th>Name in {s.upper()}</th>\n')
+    out.append("""          </tr></thead>
           <tbody>
-"""
+""")
 
     if not name_diff.empty:
-        for _, row in name_diff.iterrows():
-            html += f'          <tr>\n            <td><strong>{_esc(str(row.get("sku", "")))}</strong></td>\n'
+        for row in name_diff.itertuples(index=False):
+            out.append(f'          <tr>\n            <td><strong>{_esc(str(getattr(row, "sku", "")))}</strong></td>\n')
             for s in source_names:
-                html += f'            <td>{_esc(str(row.get(f"name_{s}", "")))}</td>\n'
-            html += '          </tr>\n'
+                out.append(f'            <td>{_esc(str(getattr(row, f"name_{s}", "")))}</td>\n')
+            out.append('          </tr>\n')
 
-    html += """          </tbody>
+    out.append("""          </tbody>
         </table>
       </div>
     </div>
   </div>
-"""
+""")
+
+    yield "".join(out)
 
     # === TAB: Attribute Differences ===
-    html += """
+    out = ["""
   <div class="tab-content" id="tab-attrs">
     <div class="table-wrap">
       <div class="search-bar"><input type="text" placeholder="Search by SKU, name or attribute..." onkeyup="filterTable(this, 'attr-table')"></div>
@@ -552,41 +431,47 @@ def generate_html(results, output_path=None):
             <th>SKU</th>
             <th>Product Name</th>
             <th>Attribute</th>
-"""
+"""]
     for s in source_names:
-        html += f'            <th>Value {s.upper()}</th>\n'
-    html += """            <th>Difference</th>
+        out.append(f'            <th>Value {s.upper()}</th>\n')
+    out.append("""            <th>Difference</th>
           </tr></thead>
           <tbody>
-"""
+""")
 
+    rows = []
     if not attr_diff.empty:
-        for _, row in attr_diff.iterrows():
-            sku = str(row.get("sku", ""))
-            name = str(row.get("product_name", ""))[:60]
-            attr = str(row.get("attribute", ""))
-            diff = row.get("diff", 0)
-
-            html += f'          <tr>\n            <td><strong>{_esc(sku)}</strong></td>\n            <td>{_esc(name)}</td>\n'
-            html += f'            <td>{_esc(attr)}</td>\n'
+        for row in attr_diff.itertuples(index=False):
+            sku = str(getattr(row, "sku", ""))
+            name = str(getattr(row, "product_name", ""))[:60]
+            attr = str(getattr(row, "attribute", ""))
+            diff = getattr(row, "diff", 0)
+
+            tr = [f'<tr><td><strong>{_esc(sku)}</strong></td><td>{_esc(name)}</td>']
+            tr.append(f'<td>{_esc(attr)}</td>')
             for s in source_names:
-                v = row.get(f"value_{s}", "")
+                v = getattr(row, f"value_{s}", "")
                 if v and str(v) != "" and str(v) != "nan":
-                    html += f'            <td class="price">{_esc(str(v))}</td>\n'
+                    tr.append(f'<td class="price">{_esc(str(v))}</td>')
                 else:
-                    html += '            <td class="text-muted">&mdash;</td>\n'
-            html += f'            <td class="price price-diff">{diff}</td>\n'
-            html += '          </tr>\n'
+                    tr.append('<td class="text-muted">&mdash;</td>')
+            tr.append(f'<td class="price price-diff">{diff}</td>')
+            tr.append('</tr>')
+            rows.append(_paged_row(tr))
 
-    html += """          </tbody>
+    out.append("""          </tbody>
         </table>
       </div>
-    </div>
+""")
+    out.append(_paged_table("attr-table", rows))
+    out.append("""    </div>
   </div>
-"""
+""")
+
+    yield "".join(out)
 
     # === TAB: Name vs Attributes ===
-    html += """
+    out = ["""
   <div class="tab-content" id="tab-namecheck">
     <div class="table-wrap">
       <div class="search-bar">
@@ -610,43 +495,49 @@ def generate_html(results, output_path=None):
             <th>Status</th>
           </tr></thead>
           <tbody>
-"""
+"""]
 
+    rows = []
     if not name_vs_attrs.empty:
-        for _, row in name_vs_attrs.iterrows():
-            status = str(row.get("status", ""))
+        for row in name_vs_attrs.itertuples(index=False):
+            status = str(getattr(row, "status", ""))
             status_cls = "price-diff" if status == "MISMATCH" else "text-warn"
             status_tag = f'<span class="tag tag-no">{status}</span>' if status == "MISMATCH" else f'<span class="tag" style="background:rgba(245,158,11,0.15);color:#fbbf24;">{status}</span>'
 
-            html += '          <tr>\n'
-            html += f'            <td>{_esc(str(row.get("category", "")))}</td>\n'
-            html += f'            <td><strong>{_esc(str(row.get("sku", "")))}</strong></td>\n'
-            html += f'            <td>{_esc(str(row.get("product_title", "")))}</td>\n'
-            html += f'            <td><strong>{_esc(str(row.get("attribute", "")))}</strong></td>\n'
-            html += f'            <td style="color:var(--accent);">{_esc(str(row.get("from_name", "")))}</td>\n'
+            tr = ['<tr>']
+            tr.append(f'<td>{_esc(str(getattr(row, "category", "")))}</td>')
+            tr.append(f'<td><strong>{_esc(str(getattr(row, "sku", "")))}</strong></td>')
+            tr.append(f'<td>{_esc(str(getattr(row, "product_title", "")))}</td>')
+            tr.append(f'<td><strong>{_esc(str(getattr(row, "attribute", "")))}</strong></td>')
+            tr.append(f'<td style="color:var(--accent);">{_esc(str(getattr(row, "from_name", "")))}</td>')
 
-            wv = str(row.get("website_value", "—"))
-            gv = str(row.get("google_value", "—"))
-            wm = str(row.get("web_match", "—"))
-            gm = str(row.get("google_match", "—"))
+            wv = str(getattr(row, "website_value", "—"))
+            gv = str(getattr(row, "google_value", "—"))
+            wm = str(getattr(row, "web_match", "—"))
+            gm = str(getattr(row, "google_match", "—"))
 
             w_style = 'color:var(--red);' if wm == "No" else ('color:var(--green);' if wm == "Yes" else 'color:var(--muted);')
             g_style = 'color:var(--red);' if gm == "No" else ('color:var(--green);' if gm == "Yes" else 'color:var(--muted);')
 
-            html += f'            <td style="{w_style}">{_esc(wv)}</td>\n'
-            html += f'            <td style="{g_style}">{_esc(gv)}</td>\n'
-            html += f'            <td>{status_tag}</td>\n'
-            html += '          </tr>\n'
+            tr.append(f'<td style="{w_style}">{_esc(wv)}</td>')
+            tr.append(f'<td style="{g_style}">{_esc(gv)}</td>')
+            tr.append(f'<td>{status_tag}</td>')
+            tr.append('</tr>')
+            rows.append(_paged_row(tr))
 
-    html += """          </tbody>
+    out.append("""          </tbody>
         </table>
       </div>
-    </div>
+""")
+    out.append(_paged_table("namecheck-table", rows))
+    out.append("""    </div>
   </div>
-"""
+""")
+
+    yield "".join(out)
 
     # === TAB: All Products ===
-    html += """
+    out = ["""
   <div class="tab-content" id="tab-all">
     <div class="table-wrap">
       <div class="search-bar"><input type="text" placeholder="Search by SKU or product name..." onkeyup="filterTable(this, 'all-table')"></div>
@@ -655,99 +546,65 @@ def generate_html(results, output_path=None):
           <thead><tr>
             <th>SKU</th>
             <th>Product Name</th>
-"""
+"""]
     for s in source_names:
-        html += f'            <th>Price {s.upper()}</th>\n'
+        out.append(f'            <th>Price {s.upper()}</th>\n')
     for s in source_names:
-        html += f'            <th>In {s.upper()}</th>\n'
-    html += """            <th>Zoho Status</th>
+        out.append(f'            <th>In {s.upper()}</th>\n')
+    out.append("""            <th>Zoho Status</th>
             <th>Details</th>
           </tr></thead>
           <tbody>
-"""
-
-    for idx, row in merged.iterrows():
-        sku = str(row.get("sku", ""))
-        name = ""
-        for s in source_names:
-            if row.get(f"name_{s}"):
-                name = str(row[f"name_{s}"])[:80]
-                break
-        zoho_status = str(row.get("status_zoho", "")) if pd.notna(row.get("status_zoho")) else ""
-
-        html += f'          <tr>\n            <td><strong>{_esc(sku)}</strong></td>\n            <td>{_esc(name)}</td>\n'
-        for s in source_names:
-            p = row.get(f"price_{s}")
-            html += f'            <td class="price">{_fmt_price(p)}</td>\n'
-        for s in source_names:
-            in_s = row.get(f"in_{s}", False)
+""")
+
+    # Only the columns this tab reads, as plain tuples: sku, names, prices, in flags
+    n = len(source_names)
+    cols = (["sku"] + [f"name_{s}" for s in source_names] + [f"price_{s}" for s in source_names]
+            + [f"in_{s}" for s in source_names])
+    rows = []
+    records = merged.reindex(columns=cols).itertuples(index=True, name=None)
+    for (idx, sku, *vals), zoho_status in zip(records, zoho_statuses):
+        sku = str(sku)
+        names, prices, present = vals[:n], vals[n:2 * n], vals[2 * n:]
+        name = next((str(v)[:80] for v in names if v), "")
+
+        tr = [f'<tr><td><strong>{_esc(sku)}</strong></td><td>{_esc(name)}</td>']
+        for p in prices:
+            tr.append(f'<td class="price">{_fmt_price(p)}</td>')
+        for in_s in present:
             if in_s:
-                html += '            <td><span class="tag tag-yes">&#10003;</span></td>\n'
+                tr.append('<td><span class="tag tag-yes">&#10003;</span></td>')
             else:
-                html += '            <td><span class="tag tag-no">&#10007;</span></td>\n'
-        html += f'            <td>{_fmt_status(zoho_status)}</td>\n'
-        html += f'            <td><span class="expand-btn" onclick="toggleDetail(\'al-{idx}\')">&#9660;</span></td>\n'
-        html += '          </tr>\n'
-        html += _build_detail_row(f"al-{idx}", sku, source_names, zoho_attrs, web_attrs, google_attrs)
-
-    html += """          </tbody>
+                tr.append('<td><span class="tag tag-no">&#10007;</span></td>')
+        tr.append(f'<td>{_fmt_status(zoho_status)}</td>')
+        tr.append(f'<td><span class="expand-btn" onclick="toggleDetail(\'al-{idx}\')">&#9660;</span></td>')
+        tr.append('</tr>')
+        detail = _build_detail_row(f"al-{idx}", sku)
+        rows.append(_paged_row(tr, detail))
+
+    out.append("""          </tbody>
         </table>
       </div>
-    </div>
+""")
+    out.append(_paged_table("all-table", rows))
+    out.append("""    </div>
   </div>
 
 </div>
 
-<script>
-function showTab(name) {
-  document.querySelectorAll('.tab-content').forEach(el => el.classList.remove('active'));
-  document.querySelectorAll('.tab').forEach(el => el.classList.remove('active'));
-  document.getElementById('tab-' + name).classList.add('active');
-  event.currentTarget.classList.add('active');
-}
-
-function toggleDetail(id) {
-  const row = document.getElementById(id);
-  if (!row) return;
-  row.classList.toggle('open');
-  row.style.display = row.classList.contains('open') ? 'table-row' : '';
-}
-
-function filterTable(input, tableId) {
-  const filter = input.value.toLowerCase();
-  const table = document.getElementById(tableId);
-  const rows = table.querySelectorAll('tbody tr:not(.detail-row)');
-  rows.forEach(row => {
-    const text = row.textContent.toLowerCase();
-    const show = text.includes(filter);
-    row.style.display = show ? '' : 'none';
-    const next = row.nextElementSibling;
-    if (next && next.classList.contains('detail-row')) {
-      next.classList.remove('open');
-      next.style.display = '';
-    }
-  });
-}
-
-function filterByStatus(select, tableId) {
-  const filter = select.value.toUpperCase();
-  const table = document.getElementById(tableId);
-  const rows = table.querySelectorAll('tbody tr');
-  rows.forEach(row => {
-    if (!filter) { row.style.display = ''; return; }
-    const text = row.textContent.toUpperCase();
-    row.style.display = text.includes(filter) ? '' : 'none';
-  });
-}
-</script>
+""")
+    # Only SKUs listed in a tab with detail rows need their attributes in the page
+    needed = set()
+    for df in (price_diff, missing, merged):
+        if "sku" in df.columns:
+            needed.update(df["sku"].astype(str).str.strip().str.upper())
+    attr_sources = {"zoho": zoho_attrs, "website": web_attrs, "google": google_attrs}
+    out.append(_attr_data(source_names, attr_sources, needed))
+    # The script stays inline: the paged tables are empty until it runs
+    out.append("<script>\n" + REPORT_JS + """</script>
 </body>
-</html>"""
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
-
-    print(f"  HTML report: {output_path}")
-    return output_path
+</html>""")
+    yield "".join(out)
 
 
 def _esc(text):
@@ -763,9 +620,16 @@ def _fmt_price(val):
     """Format price."""
     if pd.isna(val) or val is None:
         return '<span class="text-muted">—</span>'
-    return f"${float(val):,.2f}"
+    return _fmt_amount(float(val))
 
 
+@lru_cache(maxsize=65536)
+def _fmt_amount(value):
+    """$1,234.50 — cached, catalogs repeat the same prices a lot."""
+    return f"${value:,.2f}"
+
+
+@lru_cache(maxsize=256)
 def _fmt_status(status):
     """Format Zoho active/inactive status."""
     if not status or str(status).strip().lower() in ("", "nan", "none"):
@@ -778,46 +642,428 @@ def _fmt_status(status):
     return _esc(s)
 
 
-def _get_zoho_status(sku, merged):
-    """Get Zoho status from merged data."""
-    match = merged[merged["sku"] == sku]
-    if not match.empty:
-        val = match.iloc[0].get("status_zoho", "")
-        if pd.notna(val):
-            return str(val)
-    return ""
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _write_asset(path, content):
+    """Write a static file next to the report unless it already has this content."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == content:
+                return
+    except OSError:
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def _json_script(obj):
+    """JSON for a <script type="application/json"> block."""
+    # "</" inside the JSON would end the script element early
+    return json.dumps(obj, ensure_ascii=False).replace("</", "<\\/")
+
+
+def _search_text(row_html):
+    """Lowercase visible text of a table row, matched against the search box."""
+    return " ".join(_html_unescape(_TAG_RE.sub(" ", row_html)).split()).lower()
+
+
+def _paged_row(tr, detail=""):
+    """[search text, row HTML] for a paged table; only the main row's visible text is searched."""
+    row_html = "".join(tr)
+    return [_search_text(row_html), row_html + detail]
 
 
-def _build_detail_row(row_id, sku, source_names, zoho_attrs, web_attrs, google_attrs):
-    """Build expandable detail row with attributes from all sources."""
+def _paged_table(table_id, rows):
+    """Pager and JSON row data for a table rendered a page at a time in the browser."""
+    data = _json_script(rows)
+    return (f'      <div class="pager" id="{table_id}-pager">'
+            f'<button onclick="turnPage(\'{table_id}\', -1)">&#9664; Prev</button><span></span>'
+            f'<button onclick="turnPage(\'{table_id}\', 1)">Next &#9654;</button></div>\n'
+            f'      <script type="application/json" class="table-data" data-table="{table_id}">{data}</script>\n')
+
+
+def _build_detail_row(row_id, sku):
+    """Build an empty expandable detail row; the browser fills it from the attribute data."""
     sku_upper = str(sku).strip().upper()
+    return f'<tr class="detail-row" id="{row_id}" data-sku="{_esc(sku_upper)}"><td colspan="20" class="detail-cell"></td></tr>\n'
+
+
+def _attr_data(source_names, attr_sources, needed):
+    """JSON blocks of displayable attributes per source for the needed SKUs, {SKU: [[name, value], ...]}."""
+    blocks = []
+    for s in source_names:
+        data = {
+            sku: [[str(k), str(v)] for k, v in attrs.items()
+                  if v and str(v).strip() and str(v).strip().lower() not in ("nan", "none")]
+            for sku, attrs in attr_sources.get(s, {}).items()
+            if attrs and sku in needed
+        }
+        blocks.append(f'<script type="application/json" class="attr-data" data-source="{s}">{_json_script(data)}</script>\n')
+    return "".join(blocks)
+
 
-    attr_sources = {
-        "zoho": zoho_attrs.get(sku_upper, {}),
-        "website": web_attrs.get(sku_upper, {}),
-        "google": google_attrs.get(sku_upper, {}),
+# ============================================================
+# STATIC ASSETS (report.css is written next to the report; the script is inlined)
+# ============================================================
+
+REPORT_CSS = """  :root {
+    --bg: #0f172a;
+    --card: #1e293b;
+    --border: #334155;
+    --text: #e2e8f0;
+    --muted: #94a3b8;
+    --accent: #3b82f6;
+    --green: #22c55e;
+    --red: #ef4444;
+    --orange: #f59e0b;
+    --purple: #a78bfa;
+  }
+  * { margin:0; padding:0; box-sizing:border-box; }
+  body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, sans-serif;
+    background: var(--bg);
+    color: var(--text);
+    line-height: 1.5;
+    padding: 20px;
+  }
+  .container { max-width: 1600px; margin: 0 auto; }
+  h1 {
+    font-size: 1.75rem;
+    font-weight: 700;
+    margin-bottom: 8px;
+  }
+  .subtitle { color: var(--muted); margin-bottom: 24px; }
+
+  /* Stats cards */
+  .stats {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
+    gap: 12px;
+    margin-bottom: 32px;
+  }
+  .stat-card {
+    background: var(--card);
+    border: 1px solid var(--border);
+    border-radius: 12px;
+    padding: 16px 20px;
+  }
+  .stat-card .num {
+    font-size: 2rem;
+    font-weight: 700;
+    line-height: 1.2;
+  }
+  .stat-card .label { color: var(--muted); font-size: 0.85rem; }
+  .stat-card.green .num { color: var(--green); }
+  .stat-card.red .num { color: var(--red); }
+  .stat-card.orange .num { color: var(--orange); }
+  .stat-card.blue .num { color: var(--accent); }
+  .stat-card.purple .num { color: var(--purple); }
+
+  /* Tabs */
+  .tabs {
+    display: flex;
+    gap: 4px;
+    margin-bottom: 0;
+    border-bottom: 2px solid var(--border);
+    padding-bottom: 0;
+  }
+  .tab {
+    padding: 10px 20px;
+    cursor: pointer;
+    border-radius: 8px 8px 0 0;
+    background: transparent;
+    color: var(--muted);
+    border: 1px solid transparent;
+    border-bottom: none;
+    font-size: 0.9rem;
+    font-weight: 500;
+    transition: all 0.15s;
+    position: relative;
+    bottom: -2px;
+  }
+  .tab:hover { color: var(--text); background: var(--card); }
+  .tab.active {
+    color: var(--accent);
+    background: var(--card);
+    border-color: var(--border);
+  }
+  .tab .badge {
+    background: var(--border);
+    color: var(--muted);
+    padding: 2px 8px;
+    border-radius: 10px;
+    font-size: 0.75rem;
+    margin-left: 6px;
+  }
+  .tab.active .badge { background: rgba(59,130,246,0.2); color: var(--accent); }
+
+  .tab-content { display: none; }
+  .tab-content.active { display: block; }
+
+  /* Tables */
+  .table-wrap {
+    background: var(--card);
+    border: 1px solid var(--border);
+    border-radius: 0 12px 12px 12px;
+    overflow: hidden;
+    margin-bottom: 32px;
+  }
+  .search-bar {
+    padding: 12px 16px;
+    border-bottom: 1px solid var(--border);
+  }
+  .search-bar input {
+    width: 100%;
+    max-width: 400px;
+    padding: 8px 12px;
+    border-radius: 8px;
+    border: 1px solid var(--border);
+    background: var(--bg);
+    color: var(--text);
+    font-size: 0.9rem;
+  }
+  .search-bar input::placeholder { color: var(--muted); }
+  table {
+    width: 100%;
+    border-collapse: collapse;
+    font-size: 0.85rem;
+  }
+  thead th {
+    background: rgba(0,0,0,0.2);
+    padding: 10px 12px;
+    text-align: left;
+    font-weight: 600;
+    color: var(--muted);
+    text-transform: uppercase;
+    font-size: 0.75rem;
+    letter-spacing: 0.05em;
+    border-bottom: 1px solid var(--border);
+    position: sticky;
+    top: 0;
+    white-space: nowrap;
+  }
+  td {
+    padding: 8px 12px;
+    border-bottom: 1px solid var(--border);
+    vertical-align: top;
+  }
+  tr:hover { background: rgba(255,255,255,0.03); }
+  .scrollable { max-height: 70vh; overflow-y: auto; }
+
+  /* Tags */
+  .tag {
+    display: inline-block;
+    padding: 2px 8px;
+    border-radius: 6px;
+    font-size: 0.75rem;
+    font-weight: 500;
+  }
+  .tag-zoho { background: rgba(59,130,246,0.15); color: #60a5fa; }
+  .tag-website { background: rgba(34,197,94,0.15); color: #4ade80; }
+  .tag-google { background: rgba(168,85,247,0.15); color: #c084fc; }
+  .tag-yes { background: rgba(34,197,94,0.15); color: #4ade80; }
+  .tag-no { background: rgba(239,68,68,0.15); color: #f87171; }
+
+  .price { font-family: 'SF Mono', Monaco, monospace; }
+  .price-diff { color: var(--red); font-weight: 600; }
+  .price-match { color: var(--green); }
+  .text-muted { color: var(--muted); }
+  .text-warn { color: var(--orange); }
+
+  /* Attribute comparison */
+  .attr-table { margin-top: 4px; }
+  .attr-table td {
+    padding: 2px 8px;
+    border: none;
+    font-size: 0.8rem;
+  }
+  .attr-label { color: var(--muted); white-space: nowrap; }
+  .attr-diff { background: rgba(239,68,68,0.1); border-radius: 4px; }
+
+  /* Expand row */
+  .expand-btn {
+    cursor: pointer;
+    color: var(--accent);
+    font-size: 0.8rem;
+    text-decoration: none;
+    user-select: none;
+  }
+  .expand-btn:hover { text-decoration: underline; }
+  .detail-row { display: none; }
+  .detail-row.open { display: table-row; }
+  .detail-cell {
+    padding: 12px 24px;
+    background: rgba(0,0,0,0.15);
+  }
+  .detail-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+    gap: 16px;
+  }
+  .detail-source {
+    border: 1px solid var(--border);
+    border-radius: 8px;
+    padding: 12px;
+  }
+  .detail-source h4 {
+    font-size: 0.85rem;
+    margin-bottom: 8px;
+    display: flex;
+    align-items: center;
+    gap: 8px;
+  }
+  .detail-source table { font-size: 0.8rem; }
+  .detail-source td { padding: 3px 8px; border: none; }
+
+  /* Pager */
+  .pager {
+    display: flex;
+    align-items: center;
+    justify-content: flex-end;
+    gap: 12px;
+    padding: 8px 16px;
+    border-top: 1px solid var(--border);
+    color: var(--muted);
+    font-size: 0.8rem;
+  }
+  .pager button {
+    padding: 4px 10px;
+    border-radius: 6px;
+    border: 1px solid var(--border);
+    background: var(--bg);
+    color: var(--text);
+    cursor: pointer;
+  }
+"""
+
+REPORT_JS = """function showTab(name) {
+  document.querySelectorAll('.tab-content').forEach(el => el.classList.remove('active'));
+  document.querySelectorAll('.tab').forEach(el => el.classList.remove('active'));
+  document.getElementById('tab-' + name).classList.add('active');
+  event.currentTarget.classList.add('active');
+}
+
+// Attributes per source ({SKU: [[name, value], ...]}); a detail row is
+// filled from them the first time it is opened
+const attrData = {};
+document.querySelectorAll('script.attr-data').forEach(el => {
+  attrData[el.dataset.source] = JSON.parse(el.textContent);
+});
+
+function esc(text) {
+  return String(text).replace(/[&<>"]/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})[c]);
+}
+
+// Detail markup per SKU, built once and reused by every tab and page
+const detailHtml = {};
+
+function renderDetail(sku) {
+  if (sku in detailHtml) return detailHtml[sku];
+  const parts = ['<div class="detail-grid">'];
+  for (const source of Object.keys(attrData)) {
+    const pairs = attrData[source][sku];
+    parts.push('<div class="detail-source"><h4><span class="tag tag-' + source + '">' + source.toUpperCase() + '</span> Attributes</h4>');
+    if (pairs) {
+      parts.push('<table class="attr-table">');
+      pairs.forEach(([name, value]) => parts.push('<tr><td class="attr-label">' + esc(name) + '</td><td>' + esc(value) + '</td></tr>'));
+      parts.push('</table>');
+    } else {
+      parts.push('<p class="text-muted">No data available</p>');
     }
+    parts.push('</div>');
+  }
+  parts.push('</div>');
+  return detailHtml[sku] = parts.join('');
+}
 
-    html = f'          <tr class="detail-row" id="{row_id}"><td colspan="20" class="detail-cell">\n'
-    html += '            <div class="detail-grid">\n'
+function toggleDetail(id) {
+  const row = document.getElementById(id);
+  if (!row) return;
+  const cell = row.firstElementChild;
+  if (!cell.hasChildNodes()) cell.innerHTML = renderDetail(row.dataset.sku);
+  row.classList.toggle('open');
+  row.style.display = row.classList.contains('open') ? 'table-row' : '';
+}
 
-    for s in source_names:
-        attrs = attr_sources.get(s, {})
-        tag_class = f"tag-{s}"
-        html += f'              <div class="detail-source">\n'
-        html += f'                <h4><span class="tag {tag_class}">{s.upper()}</span> Attributes</h4>\n'
-
-        if attrs:
-            html += '                <table class="attr-table">\n'
-            for k, v in attrs.items():
-                if v and str(v).strip() and str(v).strip().lower() not in ("nan", "none"):
-                    html += f'                  <tr><td class="attr-label">{_esc(k)}</td><td>{_esc(str(v))}</td></tr>\n'
-            html += '                </table>\n'
-        else:
-            html += '                <p class="text-muted">No data available</p>\n'
-
-        html += '              </div>\n'
-
-    html += '            </div>\n'
-    html += '          </td></tr>\n'
-    return html
+// Paged tables: rows ([search text, row HTML]) come from a JSON block, and
+// only the current page is put in the DOM
+const PAGE_SIZE = 100;
+const pagedTables = {};
+
+function initPagedTables() {
+  document.querySelectorAll('script.table-data').forEach(el => {
+    const rows = JSON.parse(el.textContent);
+    pagedTables[el.dataset.table] = {rows: rows, view: rows, page: 0, query: '', status: ''};
+    renderPage(el.dataset.table);
+  });
+}
+
+function renderPage(tableId) {
+  const t = pagedTables[tableId];
+  const pages = Math.max(1, Math.ceil(t.view.length / PAGE_SIZE));
+  t.page = Math.min(Math.max(t.page, 0), pages - 1);
+  const start = t.page * PAGE_SIZE;
+  document.querySelector('#' + tableId + ' tbody').innerHTML =
+    t.view.slice(start, start + PAGE_SIZE).map(r => r[1]).join('');
+  document.querySelector('#' + tableId + '-pager span').textContent =
+    'Page ' + (t.page + 1) + ' of ' + pages + ' (' + t.view.length + ' rows)';
+}
+
+function turnPage(tableId, step) {
+  pagedTables[tableId].page += step;
+  renderPage(tableId);
+}
+
+function filterPaged(tableId) {
+  const t = pagedTables[tableId];
+  t.view = t.rows.filter(r => r[0].includes(t.query) && r[0].includes(t.status));
+  t.page = 0;
+  renderPage(tableId);
+}
+
+// Keystrokes within 100 ms are filtered once
+let filterTimer = null;
+
+function filterTable(input, tableId) {
+  clearTimeout(filterTimer);
+  filterTimer = setTimeout(() => applyFilter(input.value.toLowerCase(), tableId), 100);
+}
+
+function applyFilter(filter, tableId) {
+  if (pagedTables[tableId]) {
+    pagedTables[tableId].query = filter;
+    filterPaged(tableId);
+    return;
+  }
+  const table = document.getElementById(tableId);
+  const rows = table.querySelectorAll('tbody tr:not(.detail-row)');
+  rows.forEach(row => {
+    const show = (row.dataset.search || '').includes(filter);
+    row.style.display = show ? '' : 'none';
+    const next = row.nextElementSibling;
+    if (next && next.classList.contains('detail-row')) {
+      next.classList.remove('open');
+      next.style.display = '';
+    }
+  });
+}
+
+function filterByStatus(select, tableId) {
+  const filter = select.value.toUpperCase();
+  if (pagedTables[tableId]) {
+    pagedTables[tableId].status = filter.toLowerCase();
+    filterPaged(tableId);
+    return;
+  }
+  const table = document.getElementById(tableId);
+  const rows = table.querySelectorAll('tbody tr');
+  rows.forEach(row => {
+    if (!filter) { row.style.display = ''; return; }
+    const text = row.textContent.toUpperCase();
+    row.style.display = text.includes(filter) ? '' : 'none';
+  });
+}
+
+initPagedTables();
+"""